@@ -0,0 +1,257 @@
+#!/usr/bin/env node
+
+/**
+ * UPI Guard Fraud Database Benchmark
+ * Runs the fraud database engine under Node against an in-memory IndexedDB
+ * (fake-indexeddb, installed on demand) and a localStorage shim. For each
+ * database size it streams seeded synthetic reports (src/utils/syntheticData.js)
+ * through the bulk import, then times the engine's public operations: ops/sec,
+ * p50/p99 latency and heap growth per operation.
+ *
+ *   npm run bench:db -- [--sizes 1k,10k,100k,1m] [--seed 42] [--json out.json]
+ *                       [--compare baseline.json] [--ops getFraudData,searchReports]
+ *
+ * Run with --expose-gc (as the npm script does) for retained-heap figures.
+ */
+
+import { parseArgs } from 'node:util';
+import { readFileSync, writeFileSync } from 'node:fs';
+
+const { values: options } = parseArgs({
+  options: {
+    sizes: { type: 'string', default: '1k,10k,100k' },
+    seed: { type: 'string', default: '42' },
+    ops: { type: 'string' },
+    json: { type: 'string' },
+    compare: { type: 'string' }
+  }
+});
+
+// ---------------------------------------------------------------------------
+// Browser storage shims
+
+// fake-indexeddb isn't a project dependency; install it just for benchmarking
+// with `npm run bench:db:setup`. Its version is saved with the results.
+let indexedDBShim = 'preset';
+if (!globalThis.indexedDB) {
+  try {
+    await import('fake-indexeddb/auto');
+    const manifest = new URL('../node_modules/fake-indexeddb/package.json', import.meta.url);
+    indexedDBShim = `fake-indexeddb@${JSON.parse(readFileSync(manifest, 'utf8')).version}`;
+  } catch {
+    console.error('❌ The benchmark needs fake-indexeddb: npm run bench:db:setup');
+    process.exit(1);
+  }
+}
+
+// The engine only touches localStorage for legacy data and cross-tab sync
+if (!globalThis.localStorage) {
+  const items = new Map();
+  globalThis.localStorage = {
+    get length() { return items.size; },
+    key: (i) => [...items.keys()][i] ?? null,
+    getItem: (key) => (items.has(key) ? items.get(key) : null),
+    setItem: (key, value) => { items.set(key, String(value)); },
+    removeItem: (key) => { items.delete(key); },
+    clear: () => { items.clear(); }
+  };
+}
+
+const { FraudDatabase } = await import('../src/services/fraudEngine.js');
+const { default: FraudStorage } = await import('../src/services/fraudStorage.js');
+const { REPORT_CATEGORIES, createRandom, createZipf, importSyntheticReports, syntheticIdentifier } =
+  await import('../src/utils/syntheticData.js');
+
+// ---------------------------------------------------------------------------
+// Measurement
+
+const parseSize = (text) => {
+  const match = /^(\d+(?:\.\d+)?)([km]?)$/i.exec(text.trim());
+  if (!match) throw new Error(`Invalid size: ${text}`);
+  return Math.round(Number(match[1]) * { '': 1, k: 1e3, m: 1e6 }[match[2].toLowerCase()]);
+};
+
+const formatSize = (size) => (size >= 1e6 ? `${size / 1e6}m` : size >= 1e3 ? `${size / 1e3}k` : String(size));
+
+const collectGarbage = () => {
+  if (globalThis.gc) globalThis.gc();
+};
+
+const percentile = (sorted, p) => sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))];
+
+// Time `iterations` calls of run(i) after `warmup` untimed calls. The first
+// call is reported on its own since it often builds caches or indexes.
+const measure = async (run, { iterations, warmup = 2 }) => {
+  const firstStart = performance.now();
+  await run(0);
+  const firstMs = performance.now() - firstStart;
+  for (let i = 1; i < warmup; i++) await run(i);
+
+  collectGarbage();
+  const heapBefore = process.memoryUsage().heapUsed;
+  const latencies = new Float64Array(iterations);
+  let allocated = 0;
+
+  for (let i = 0; i < iterations; i++) {
+    const heapStart = process.memoryUsage().heapUsed;
+    const start = performance.now();
+    await run(warmup + i);
+    latencies[i] = performance.now() - start;
+    allocated += Math.max(0, process.memoryUsage().heapUsed - heapStart);
+  }
+
+  collectGarbage();
+  const totalMs = latencies.reduce((total, latency) => total + latency, 0);
+  latencies.sort();
+  return {
+    iterations,
+    opsPerSec: iterations / (totalMs / 1000),
+    firstMs,
+    p50Ms: percentile(latencies, 0.5),
+    p99Ms: percentile(latencies, 0.99),
+    heapPerOp: allocated / iterations,
+    retainedPerOp: globalThis.gc ? (process.memoryUsage().heapUsed - heapBefore) / iterations : null
+  };
+};
+
+// Operations to time against a seeded database of `size` reports
+const operations = (db, size, random) => {
+  // Same offender distribution as the seeded reports
+  const offender = createZipf(Math.max(1, Math.ceil(size / 4)), 1.1, random);
+  const knownIdentifier = () => syntheticIdentifier(offender()).identifier;
+  const queries = ['bank', 'kyc update', 'lottery prize', 'otp', 'qr refund'];
+  const heavy = size >= 100000;
+
+  return {
+    'getFraudData (reported)': {
+      iterations: 500,
+      run: () => db.getFraudData(knownIdentifier())
+    },
+    'getFraudData (unreported)': {
+      iterations: 500,
+      run: (i) => db.getFraudData(`unreported${i}@upi`)
+    },
+    addFraudReport: {
+      iterations: 200,
+      run: (i) => db.addFraudReport(knownIdentifier(), {
+        description: `Benchmark report ${i} asked for OTP`,
+        amount: i * 10,
+        severity: 1 + (i % 5),
+        category: REPORT_CATEGORIES[i % REPORT_CATEGORIES.length],
+        reportedBy: 'bench@example.com'
+      })
+    },
+    'searchReports (text)': {
+      iterations: heavy ? 20 : 100,
+      run: (i) => db.searchReports(queries[i % queries.length], null, null, 50)
+    },
+    'searchReports (text + filters)': {
+      iterations: heavy ? 20 : 100,
+      run: (i) => db.searchReports(queries[i % queries.length], REPORT_CATEGORIES[i % REPORT_CATEGORIES.length], 'high', 50)
+    },
+    'searchReports (filters only)': {
+      iterations: heavy ? 20 : 100,
+      run: (i) => db.searchReports('', REPORT_CATEGORIES[i % REPORT_CATEGORIES.length], null, 50)
+    },
+    getStatistics: {
+      iterations: 1000,
+      run: () => db.getStatistics()
+    },
+    updateReportsFeed: {
+      iterations: heavy ? 2 : size >= 10000 ? 5 : 20,
+      warmup: 1,
+      run: () => db.updateReportsFeed()
+    }
+  };
+};
+
+const deleteDatabase = (name) => new Promise((resolve, reject) => {
+  const request = indexedDB.deleteDatabase(name);
+  request.onsuccess = () => resolve();
+  request.onerror = () => reject(request.error);
+});
+
+const benchmarkSize = async (size, seed, only) => {
+  const name = `upi-fraud-bench-${size}`;
+  await deleteDatabase(name);
+  const db = new FraudDatabase(new FraudStorage(name), { backgroundRescore: false });
+  await db.ready;
+
+  try {
+    collectGarbage();
+    const heapBefore = process.memoryUsage().heapUsed;
+    const seedStart = performance.now();
+    await importSyntheticReports(db, { seed, reports: size });
+    const seedMs = performance.now() - seedStart;
+    collectGarbage();
+
+    const result = {
+      size,
+      seedMs,
+      seedReportsPerSec: size / (seedMs / 1000),
+      heapAfterSeed: process.memoryUsage().heapUsed - heapBefore,
+      operations: {}
+    };
+    console.log(`\n📊 ${formatSize(size)} reports — seeded in ${(seedMs / 1000).toFixed(1)} s (${Math.round(result.seedReportsPerSec)} reports/s)`);
+
+    const random = createRandom(seed + 1);
+    for (const [operation, { run, ...settings }] of Object.entries(operations(db, size, random))) {
+      if (only && !only.some(name => operation.startsWith(name))) continue;
+      result.operations[operation] = await measure(run, settings);
+    }
+    return result;
+  } finally {
+    db.close();
+    await deleteDatabase(name);
+  }
+};
+
+// ---------------------------------------------------------------------------
+// Reporting
+
+const formatBytes = (bytes) =>
+  bytes === null ? '-' : Math.abs(bytes) >= 1024 * 1024 ? `${(bytes / 1024 / 1024).toFixed(1)} MB` : `${(bytes / 1024).toFixed(1)} KB`;
+
+const formatChange = (current, baseline) => {
+  if (!baseline) return '';
+  const change = (current / baseline - 1) * 100;
+  return ` (${change >= 0 ? '+' : ''}${change.toFixed(0)}%)`;
+};
+
+const printResult = (result, baseline) => {
+  console.log(`  ${'operation'.padEnd(32)} ${'ops/s'.padStart(16)} ${'first ms'.padStart(9)} ${'p50 ms'.padStart(9)} ${'p99 ms'.padStart(9)} ${'heap/op'.padStart(10)} ${'retained/op'.padStart(12)}`);
+  Object.entries(result.operations).forEach(([operation, stats]) => {
+    const previous = baseline?.operations[operation];
+    const opsPerSec = `${stats.opsPerSec.toFixed(1)}${formatChange(stats.opsPerSec, previous?.opsPerSec)}`;
+    console.log(`  ${operation.padEnd(32)} ${opsPerSec.padStart(16)} ${stats.firstMs.toFixed(2).padStart(9)} ${stats.p50Ms.toFixed(3).padStart(9)} ${stats.p99Ms.toFixed(3).padStart(9)} ${formatBytes(stats.heapPerOp).padStart(10)} ${formatBytes(stats.retainedPerOp).padStart(12)}`);
+  });
+  console.log(`  heap after seeding: ${formatBytes(result.heapAfterSeed)}`);
+};
+
+const main = async () => {
+  const sizes = options.sizes.split(',').map(parseSize);
+  const seed = parseInt(options.seed, 10);
+  const only = options.ops ? options.ops.split(',').map(name => name.trim()) : null;
+  const baseline = options.compare ? JSON.parse(readFileSync(options.compare, 'utf8')) : null;
+
+  if (!globalThis.gc) {
+    console.log('ℹ️  Run with node --expose-gc for retained heap per operation');
+  }
+
+  const results = { seed, node: process.version, indexedDB: indexedDBShim, results: [] };
+  for (const size of sizes) {
+    const result = await benchmarkSize(size, seed, only);
+    printResult(result, baseline?.results.find(previous => previous.size === size));
+    results.results.push(result);
+  }
+
+  if (options.json) {
+    writeFileSync(options.json, JSON.stringify(results, null, 2));
+    console.log(`\n📝 Results written to ${options.json}`);
+  }
+};
+
+main().catch(error => {
+  console.error(`\n❌ ${error.stack || error.message}`);
+  process.exitCode = 1;
+});
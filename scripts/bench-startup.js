@@ -0,0 +1,524 @@
+#!/usr/bin/env node
+
+/**
+ * UPI Guard Startup Benchmark
+ * Builds the app, reports per-chunk gzip/brotli sizes, then loads the build in
+ * headless Chromium with CPU and network throttling and measures cold starts:
+ * script compile/evaluate time, first contentful paint and the time until
+ * UpiChecker is interactive. Exits non-zero when a budget is exceeded.
+ *
+ *   npm run bench:startup -- [--runs 5] [--profile fast-3g] [--no-build]
+ *                            [--sizes-only] [--json results.json] [--calibrate]
+ *                            [--compare before.json]
+ *
+ * Budgets only fail the run once calibrated: --calibrate rewrites the measured
+ * groups in startup-budget.json (sizes, and the profile's startup times when
+ * not --sizes-only) to the results plus headroom and records the date.
+ * Uncalibrated groups are placeholders and are reported as warnings.
+ *
+ * --compare prints each size and median startup metric next to the same metric
+ * in an earlier --json results file, e.g. one written from a checkout before a
+ * code-splitting change, so before/after numbers come from the same machine.
+ *
+ * Chromium is driven over the DevTools protocol pipe, so no browser automation
+ * package is needed: set CHROME_PATH if Chrome is not found automatically.
+ */
+
+import { spawn } from 'node:child_process';
+import { existsSync, mkdtempSync, readdirSync, readFileSync, rmSync, statSync, writeFileSync } from 'node:fs';
+import { createServer } from 'node:http';
+import { homedir, tmpdir } from 'node:os';
+import path from 'node:path';
+import { parseArgs } from 'node:util';
+import { brotliCompressSync, constants as zlibConstants, gzipSync } from 'node:zlib';
+
+const ROOT = path.resolve(path.dirname(new URL(import.meta.url).pathname), '..');
+
+// Network presets match Chrome DevTools' throttling (bytes/s, ms)
+const PROFILES = {
+  'fast-3g': { cpuSlowdown: 4, network: { latency: 562.5, downloadThroughput: 1.6 * 1024 * 1024 / 8 * 0.9, uploadThroughput: 750 * 1024 / 8 * 0.9 } },
+  'slow-4g': { cpuSlowdown: 4, network: { latency: 150, downloadThroughput: 1.6 * 1024 * 1024 / 8 * 0.9 * 2.5, uploadThroughput: 750 * 1024 / 8 * 0.9 } },
+  'none': { cpuSlowdown: 1, network: { latency: 0, downloadThroughput: -1, uploadThroughput: -1 } }
+};
+
+// UpiChecker counts as interactive once no long task has run for this long
+const QUIET_WINDOW_MS = 500;
+const LOAD_TIMEOUT_MS = 60000;
+
+// Calibrated budgets sit this far above the measured results
+const CALIBRATION_HEADROOM = 0.1;
+
+// Trace events summed into the compile and evaluate totals
+const COMPILE_EVENTS = new Set(['v8.compile', 'v8.compileModule', 'v8.parseOnBackground']);
+const EVALUATE_EVENTS = new Set(['EvaluateScript', 'v8.evaluateModule']);
+
+const { values: options } = parseArgs({
+  options: {
+    runs: { type: 'string', default: '3' },
+    profile: { type: 'string', default: 'fast-3g' },
+    budget: { type: 'string', default: path.join(ROOT, 'scripts', 'startup-budget.json') },
+    dist: { type: 'string', default: path.join(ROOT, 'dist') },
+    json: { type: 'string' },
+    compare: { type: 'string' },
+    chrome: { type: 'string', default: process.env.CHROME_PATH },
+    'no-build': { type: 'boolean', default: false },
+    'sizes-only': { type: 'boolean', default: false },
+    calibrate: { type: 'boolean', default: false }
+  }
+});
+
+// ---------------------------------------------------------------------------
+// Chunk sizes
+
+const formatBytes = (bytes) => `${(bytes / 1024).toFixed(1)} KB`;
+
+const listFiles = (dir) => readdirSync(dir).flatMap(name => {
+  const file = path.join(dir, name);
+  return statSync(file).isDirectory() ? listFiles(file) : [file];
+});
+
+// Every JS/CSS file in the build, marked initial when index.html loads it
+const measureChunks = (dist) => {
+  const html = readFileSync(path.join(dist, 'index.html'), 'utf8');
+  const referenced = new Set([...html.matchAll(/(?:src|href)="\/?([^"]+\.(?:js|css))"/g)].map(match => match[1]));
+
+  return listFiles(dist)
+    .filter(file => /\.(js|css)$/.test(file))
+    .map(file => {
+      const content = readFileSync(file);
+      const name = path.relative(dist, file).split(path.sep).join('/');
+      return {
+        name,
+        initial: referenced.has(name),
+        raw: content.length,
+        gzip: gzipSync(content, { level: 9 }).length,
+        brotli: brotliCompressSync(content, { params: { [zlibConstants.BROTLI_PARAM_QUALITY]: 11 } }).length
+      };
+    })
+    .sort((a, b) => b.initial - a.initial || b.gzip - a.gzip);
+};
+
+const summarizeChunks = (chunks) => {
+  const sum = (list, field) => list.reduce((total, chunk) => total + chunk[field], 0);
+  const initial = chunks.filter(chunk => chunk.initial);
+  const lazy = chunks.filter(chunk => !chunk.initial);
+  return {
+    initialGzip: sum(initial, 'gzip'),
+    initialBrotli: sum(initial, 'brotli'),
+    totalGzip: sum(chunks, 'gzip'),
+    largestLazyChunkGzip: Math.max(0, ...lazy.map(chunk => chunk.gzip))
+  };
+};
+
+// ---------------------------------------------------------------------------
+// Static server for the build (SPA fallback to index.html)
+
+const CONTENT_TYPES = {
+  '.html': 'text/html', '.js': 'text/javascript', '.css': 'text/css', '.svg': 'image/svg+xml',
+  '.png': 'image/png', '.json': 'application/json', '.wasm': 'application/wasm'
+};
+
+const serve = (dist) => new Promise(resolve => {
+  const server = createServer((request, response) => {
+    const pathname = decodeURIComponent(new URL(request.url, 'http://localhost').pathname);
+    let file = path.join(dist, pathname);
+    if (!file.startsWith(dist) || !existsSync(file) || statSync(file).isDirectory()) {
+      file = path.join(dist, 'index.html');
+    }
+    response.writeHead(200, {
+      'Content-Type': CONTENT_TYPES[path.extname(file)] || 'application/octet-stream',
+      'Cache-Control': 'no-store'
+    });
+    response.end(readFileSync(file));
+  });
+  server.listen(0, '127.0.0.1', () => resolve(server));
+});
+
+// ---------------------------------------------------------------------------
+// Chromium over the DevTools protocol pipe (NUL-delimited JSON on fds 3 and 4)
+
+const findChrome = () => {
+  const candidates = [
+    options.chrome,
+    '/usr/bin/google-chrome',
+    '/usr/bin/google-chrome-stable',
+    '/usr/bin/chromium',
+    '/usr/bin/chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
+  ];
+
+  // Browsers downloaded by puppeteer or playwright
+  const caches = [path.join(homedir(), '.cache', 'puppeteer'), path.join(homedir(), '.cache', 'ms-playwright')];
+  caches.filter(existsSync).forEach(cache => {
+    listFiles(cache)
+      .filter(file => /[/\\](chrome|chrome-headless-shell|headless_shell)(\.exe)?$/.test(file))
+      .forEach(file => candidates.push(file));
+  });
+
+  return candidates.find(candidate => candidate && existsSync(candidate));
+};
+
+class Browser {
+  constructor(executable) {
+    this.profileDir = mkdtempSync(path.join(tmpdir(), 'upi-guard-bench-'));
+    this.process = spawn(executable, [
+      '--headless=new',
+      '--remote-debugging-pipe',
+      '--no-first-run',
+      '--no-default-browser-check',
+      '--disable-extensions',
+      `--user-data-dir=${this.profileDir}`,
+      ...(process.getuid?.() === 0 ? ['--no-sandbox'] : []),
+      'about:blank'
+    ], { stdio: ['ignore', 'ignore', 'pipe', 'pipe', 'pipe'] });
+
+    // Keep the end of stderr to explain an early exit
+    this.stderr = '';
+    this.process.stderr.setEncoding('utf8');
+    this.process.stderr.on('data', chunk => { this.stderr = (this.stderr + chunk).slice(-2000); });
+    this.process.stdio[3].on('error', () => {}); // writes after exit; pending calls are rejected below
+
+    this.nextId = 1;
+    this.pending = new Map(); // message id -> { resolve, reject }
+    this.listeners = new Set();
+
+    let buffer = '';
+    this.process.stdio[4].setEncoding('utf8');
+    this.process.stdio[4].on('data', chunk => {
+      buffer += chunk;
+      let end;
+      while ((end = buffer.indexOf('\0')) !== -1) {
+        this.dispatch(JSON.parse(buffer.slice(0, end)));
+        buffer = buffer.slice(end + 1);
+      }
+    });
+    this.process.on('exit', () => {
+      this.exited = true;
+      const error = new Error(`Chromium exited${this.stderr ? `:\n${this.stderr.trim()}` : ''}`);
+      this.pending.forEach(({ reject }) => reject(error));
+      this.pending.clear();
+    });
+  }
+
+  dispatch(message) {
+    if (message.id !== undefined) {
+      const request = this.pending.get(message.id);
+      this.pending.delete(message.id);
+      if (!request) return;
+      if (message.error) request.reject(new Error(`${request.method}: ${message.error.message}`));
+      else request.resolve(message.result);
+    } else {
+      this.listeners.forEach(listener => listener(message));
+    }
+  }
+
+  send(method, params = {}, sessionId) {
+    if (this.exited) {
+      return Promise.reject(new Error(`Chromium exited${this.stderr ? `:\n${this.stderr.trim()}` : ''}`));
+    }
+    const id = this.nextId++;
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { method, resolve, reject });
+      this.process.stdio[3].write(JSON.stringify({ id, method, params, sessionId }) + '\0');
+    });
+  }
+
+  // Resolves with the params of the next matching event
+  waitFor(method, sessionId) {
+    return new Promise(resolve => {
+      const listener = (message) => {
+        if (message.method === method && message.sessionId === sessionId) {
+          this.listeners.delete(listener);
+          resolve(message.params);
+        }
+      };
+      this.listeners.add(listener);
+    });
+  }
+
+  async close() {
+    const exited = this.exited ? Promise.resolve() : new Promise(resolve => this.process.once('exit', resolve));
+    this.send('Browser.close').catch(() => {});
+    await Promise.race([exited, new Promise(resolve => setTimeout(resolve, 5000))]);
+    this.process.kill();
+    rmSync(this.profileDir, { recursive: true, force: true });
+  }
+}
+
+// ---------------------------------------------------------------------------
+// One cold start
+
+// Runs before any app script: a stored demo session skips the login screen,
+// and long tasks are recorded to find when the main thread goes quiet
+const BOOTSTRAP_SCRIPT = `
+  localStorage.setItem('demoUserLoggedIn', 'true');
+  localStorage.setItem('demoUser', JSON.stringify({ email: 'bench@example.com', displayName: 'bench' }));
+  window.__benchLongTaskEnd = 0;
+  new PerformanceObserver(list => {
+    list.getEntries().forEach(entry => {
+      window.__benchLongTaskEnd = Math.max(window.__benchLongTaskEnd, entry.startTime + entry.duration);
+    });
+  }).observe({ type: 'longtask', buffered: true });
+`;
+
+// null until UpiChecker has mounted and the main thread has been quiet since
+const READ_METRICS = `(() => {
+  const mark = performance.getEntriesByName('upi-checker-interactive')[0];
+  if (!mark) return null;
+  const interactive = Math.max(mark.startTime, window.__benchLongTaskEnd);
+  if (performance.now() - interactive < ${QUIET_WINDOW_MS}) return null;
+  const paint = performance.getEntriesByName('first-contentful-paint')[0];
+  const navigation = performance.getEntriesByType('navigation')[0];
+  return {
+    firstContentfulPaint: paint ? paint.startTime : null,
+    domContentLoaded: navigation ? navigation.domContentLoadedEventEnd : null,
+    upiCheckerMounted: mark.startTime,
+    upiCheckerInteractive: interactive
+  };
+})()`;
+
+// Sum trace event durations (ms) per thread, skipping events nested in one already counted
+const sumTraceEvents = (events, names) => {
+  const byThread = new Map();
+  events
+    .filter(event => names.has(event.name) && event.ph === 'X' && event.dur !== undefined)
+    .forEach(event => {
+      const key = `${event.pid}:${event.tid}`;
+      if (!byThread.has(key)) byThread.set(key, []);
+      byThread.get(key).push(event);
+    });
+
+  let total = 0;
+  byThread.forEach(threadEvents => {
+    threadEvents.sort((a, b) => a.ts - b.ts);
+    let coveredUntil = -Infinity;
+    threadEvents.forEach(event => {
+      if (event.ts >= coveredUntil) {
+        total += event.dur;
+        coveredUntil = event.ts + event.dur;
+      }
+    });
+  });
+  return total / 1000;
+};
+
+const measureColdStart = async (browser, url, profile) => {
+  // A fresh browser context has an empty cache and storage
+  const { browserContextId } = await browser.send('Target.createBrowserContext');
+  const { targetId } = await browser.send('Target.createTarget', { url: 'about:blank', browserContextId });
+  const { sessionId } = await browser.send('Target.attachToTarget', { targetId, flatten: true });
+  const page = (method, params) => browser.send(method, params, sessionId);
+
+  try {
+    await page('Page.enable');
+    await page('Network.enable');
+    await page('Performance.enable');
+    await page('Network.setCacheDisabled', { cacheDisabled: true });
+    await page('Network.emulateNetworkConditions', { offline: false, ...profile.network });
+    await page('Emulation.setCPUThrottlingRate', { rate: profile.cpuSlowdown });
+    await page('Page.addScriptToEvaluateOnNewDocument', { source: BOOTSTRAP_SCRIPT });
+
+    const traceEvents = [];
+    const collect = (message) => {
+      if (message.method === 'Tracing.dataCollected' && message.sessionId === sessionId) {
+        traceEvents.push(...message.params.value);
+      }
+    };
+    browser.listeners.add(collect);
+    await page('Tracing.start', {
+      transferMode: 'ReportEvents',
+      traceConfig: { includedCategories: ['v8', 'devtools.timeline', 'disabled-by-default-devtools.timeline'] }
+    });
+
+    await page('Page.navigate', { url });
+
+    let metrics = null;
+    const deadline = Date.now() + LOAD_TIMEOUT_MS;
+    while (!metrics) {
+      if (Date.now() > deadline) {
+        throw new Error(`UpiChecker did not become interactive within ${LOAD_TIMEOUT_MS / 1000}s`);
+      }
+      await new Promise(resolve => setTimeout(resolve, 100));
+      const { result } = await page('Runtime.evaluate', { expression: READ_METRICS, returnByValue: true })
+        .catch(() => ({ result: {} })); // the page may still be navigating
+      metrics = result.value || null;
+    }
+
+    const { metrics: performanceMetrics } = await page('Performance.getMetrics');
+    const metric = (name) => performanceMetrics.find(entry => entry.name === name)?.value ?? null;
+
+    const tracingComplete = browser.waitFor('Tracing.tracingComplete', sessionId);
+    await page('Tracing.end');
+    await tracingComplete;
+    browser.listeners.delete(collect);
+
+    return {
+      ...metrics,
+      scriptCompile: sumTraceEvents(traceEvents, COMPILE_EVENTS),
+      scriptEvaluate: sumTraceEvents(traceEvents, EVALUATE_EVENTS),
+      scriptDuration: metric('ScriptDuration') * 1000,
+      jsHeapUsed: metric('JSHeapUsedSize')
+    };
+  } finally {
+    await browser.send('Target.disposeBrowserContext', { browserContextId }).catch(() => {});
+  }
+};
+
+const median = (values) => {
+  const sorted = values.filter(value => value !== null).sort((a, b) => a - b);
+  if (!sorted.length) return null;
+  const middle = sorted.length >> 1;
+  return sorted.length % 2 ? sorted[middle] : (sorted[middle - 1] + sorted[middle]) / 2;
+};
+
+// ---------------------------------------------------------------------------
+// Budgets
+
+// [{ group, metric, actual, budget }] for every metric over its budget
+const checkBudgets = (budgets, results) =>
+  Object.entries(budgets).flatMap(([group, limits]) =>
+    Object.entries(limits)
+      .filter(([metric, budget]) => results[group]?.[metric] != null && results[group][metric] > budget)
+      .map(([metric, budget]) => ({ group, metric, actual: results[group][metric], budget }))
+  );
+
+// Budgets from measured results plus headroom, rounded up to the next KB
+// (sizes) or 10 ms (times). Metrics that weren't measured keep their budget.
+const calibrateBudgets = (limits, measured, step) =>
+  Object.fromEntries(Object.entries(limits).map(([metric, budget]) => [
+    metric,
+    measured[metric] == null ? budget : Math.ceil(measured[metric] * (1 + CALIBRATION_HEADROOM) / step) * step
+  ]));
+
+// Before/after lines for every metric measured in both result sets
+const compareResults = (before, after) => {
+  const groups = [['sizes', formatBytes], ['startup', (value) => `${value.toFixed(1)} ms`]];
+  return groups.flatMap(([group, format]) =>
+    Object.entries(after[group] || {})
+      .filter(([metric, value]) => value != null && before[group]?.[metric] != null)
+      .map(([metric, value]) => {
+        const previous = before[group][metric];
+        const change = previous ? `${value >= previous ? '+' : ''}${((value - previous) / previous * 100).toFixed(1)}%` : '-';
+        return `  ${`${group}.${metric}`.padEnd(32)} ${format(previous).padStart(10)} → ${format(value).padStart(10)}  ${change}`;
+      })
+  );
+};
+
+// ---------------------------------------------------------------------------
+
+const main = async () => {
+  const profile = PROFILES[options.profile];
+  if (!profile) {
+    throw new Error(`Unknown profile "${options.profile}" (expected ${Object.keys(PROFILES).join(', ')})`);
+  }
+  const runs = Math.max(1, parseInt(options.runs, 10) || 1);
+  const dist = path.resolve(options.dist);
+
+  if (!options['no-build']) {
+    console.log('🔨 Building...');
+    const { build } = await import('vite');
+    await build({ root: ROOT, logLevel: 'warn', build: { outDir: dist, emptyOutDir: true } });
+  }
+
+  console.log('\n📦 Chunk sizes:');
+  const chunks = measureChunks(dist);
+  chunks.forEach(chunk => {
+    console.log(`  ${chunk.initial ? '*' : ' '} ${chunk.name.padEnd(48)} ${formatBytes(chunk.raw).padStart(10)}  gzip ${formatBytes(chunk.gzip).padStart(9)}  br ${formatBytes(chunk.brotli).padStart(9)}`);
+  });
+  const sizes = summarizeChunks(chunks);
+  console.log(`  (* loaded by index.html) initial gzip ${formatBytes(sizes.initialGzip)}, brotli ${formatBytes(sizes.initialBrotli)}; total gzip ${formatBytes(sizes.totalGzip)}`);
+
+  const results = { profile: options.profile, runs, sizes, chunks, startup: null, samples: [] };
+
+  if (!options['sizes-only']) {
+    const executable = findChrome();
+    if (!executable) {
+      throw new Error('Chrome/Chromium not found: set CHROME_PATH or pass --chrome');
+    }
+
+    const server = await serve(dist);
+    const url = `http://127.0.0.1:${server.address().port}/`;
+    const browser = new Browser(executable);
+
+    try {
+      console.log(`\n⏱️  Cold starts (${options.profile}, ${profile.cpuSlowdown}x CPU slowdown):`);
+      for (let run = 0; run < runs; run++) {
+        const sample = await measureColdStart(browser, url, profile);
+        results.samples.push(sample);
+        console.log(`  run ${run + 1}: FCP ${sample.firstContentfulPaint?.toFixed(0)} ms, UpiChecker interactive ${sample.upiCheckerInteractive.toFixed(0)} ms, compile ${sample.scriptCompile.toFixed(1)} ms`);
+      }
+    } finally {
+      await browser.close();
+      server.close();
+    }
+
+    results.startup = Object.fromEntries(
+      Object.keys(results.samples[0]).map(metric => [metric, median(results.samples.map(sample => sample[metric]))])
+    );
+    console.log('\n  median:');
+    Object.entries(results.startup).forEach(([metric, value]) => {
+      const formatted = value === null ? '-' : metric === 'jsHeapUsed' ? formatBytes(value) : `${value.toFixed(1)} ms`;
+      console.log(`    ${metric.padEnd(24)} ${formatted}`);
+    });
+  }
+
+  if (options.json) {
+    writeFileSync(options.json, JSON.stringify(results, null, 2));
+    console.log(`\n📝 Results written to ${options.json}`);
+  }
+
+  if (options.compare) {
+    const before = JSON.parse(readFileSync(options.compare, 'utf8'));
+    if (before.profile !== results.profile) {
+      console.log(`\n⚠️  ${options.compare} was measured with profile ${before.profile}, not ${results.profile}`);
+    }
+    console.log(`\n📊 Compared with ${options.compare}:`);
+    compareResults(before, results).forEach(line => console.log(line));
+  }
+
+  const budgets = JSON.parse(readFileSync(options.budget, 'utf8'));
+  budgets.calibration = budgets.calibration || {};
+
+  // Calibration is recorded per group: sizes, and startup times per profile
+  const calibrationKey = (group) => (group === 'sizes' ? 'sizes' : options.profile);
+
+  if (options.calibrate) {
+    const date = new Date().toISOString().slice(0, 10);
+    budgets.sizes = calibrateBudgets(budgets.sizes, results.sizes, 1024);
+    budgets.calibration.sizes = date;
+    if (results.startup) {
+      budgets.startup[options.profile] = calibrateBudgets(budgets.startup[options.profile], results.startup, 10);
+      budgets.calibration[options.profile] = date;
+    }
+    writeFileSync(options.budget, JSON.stringify(budgets, null, 2) + '\n');
+    console.log(`\n📝 Budgets calibrated (+${CALIBRATION_HEADROOM * 100}% headroom) in ${options.budget}`);
+    return;
+  }
+
+  const profileBudgets = { sizes: budgets.sizes, startup: budgets.startup?.[options.profile] };
+  const failures = checkBudgets(profileBudgets, results);
+  const format = (group, value) => (group === 'sizes' ? formatBytes(value) : `${value.toFixed(0)} ms`);
+  const enforced = failures.filter(({ group }) => budgets.calibration[calibrationKey(group)]);
+  const advisory = failures.filter(({ group }) => !budgets.calibration[calibrationKey(group)]);
+
+  if (advisory.length) {
+    console.log('\n⚠️  Over uncalibrated budget (not enforced; calibrate with --calibrate):');
+    advisory.forEach(({ group, metric, actual, budget }) => {
+      console.log(`  ${group}.${metric}: ${format(group, actual)} (budget ${format(group, budget)})`);
+    });
+  }
+  if (enforced.length) {
+    console.log('\n❌ Over budget:');
+    enforced.forEach(({ group, metric, actual, budget }) => {
+      console.log(`  ${group}.${metric}: ${format(group, actual)} (budget ${format(group, budget)})`);
+    });
+    process.exitCode = 1;
+  } else {
+    console.log(advisory.length ? '\n✅ Within calibrated budgets' : '\n✅ Within budget');
+  }
+};
+
+main().catch(error => {
+  console.error(`\n❌ ${error.message}`);
+  process.exitCode = 1;
+});
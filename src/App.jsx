@@ -1,24 +1,70 @@
-import React, { useState, useEffect } from 'react';
-import { onAuthStateChanged } from 'firebase/auth';
-import { auth } from './config/firebase';
+import React, { useState, useEffect, lazy, Suspense } from 'react';
+import { isFirebaseConfigured, getFirebaseAuth } from './config/firebase';
 import Login from './components/Login';
 import Signup from './components/Signup';
 import SlidingNavigation from './components/SlidingNavigation';
-import UpiChecker from './components/UpiChecker';
-import QrScanner from './components/QrScanner';
-import FraudReporting from './components/FraudReporting';
-import ChatSupport from './components/ChatSupport';
-import PhoneChecker from './components/PhoneChecker';
-import LinkChecker from './components/LinkChecker';
-import UserProfile from './components/UserProfile';
-import FraudDatabase from './components/FraudDatabase';
+import ViewErrorBoundary from './components/ViewErrorBoundary';
 import './App.css';
 
+// Each view is its own chunk, loaded the first time it is shown. The loaders
+// are kept so views can be fetched ahead of time (import() runs them once).
+const viewLoaders = {
+  'upi-checker': () => import('./components/UpiChecker'),
+  'qr-scanner': () => import('./components/QrScanner'),
+  'phone-checker': () => import('./components/PhoneChecker'),
+  'link-checker': () => import('./components/LinkChecker'),
+  'fraud-reporting': () => import('./components/FraudReporting'),
+  'fraud-database': () => import('./components/FraudDatabase'),
+  'chat-support': () => import('./components/ChatSupport'),
+  'profile': () => import('./components/UserProfile')
+};
+
+const views = Object.fromEntries(
+  Object.entries(viewLoaders).map(([key, load]) => [key, lazy(load)])
+);
+
+const DEFAULT_VIEW = 'upi-checker';
+
+// A lazy component that failed to load stays failed; retrying needs a new one
+const reloadView = (key) => {
+  views[key] = lazy(viewLoaders[key]);
+};
+
+// Small views users usually open next, fetched once the browser is idle.
+// Heavier ones (the QR scanner) wait for a hover or focus on their nav item.
+const IDLE_PREFETCH_VIEWS = ['fraud-reporting', 'phone-checker', 'link-checker'];
+
+const prefetchView = (key) => {
+  if (viewLoaders[key]) {
+    viewLoaders[key]().catch(() => {}); // a failed prefetch is retried when shown
+  }
+};
+
+const whenIdle = (callback) => {
+  if (typeof requestIdleCallback === 'function') {
+    const handle = requestIdleCallback(callback, { timeout: 5000 });
+    return () => cancelIdleCallback(handle);
+  }
+  const timer = setTimeout(callback, 2000);
+  return () => clearTimeout(timer);
+};
+
 function App() {
   const [user, setUser] = useState(null);
   const [loading, setLoading] = useState(true);
   const [authMode, setAuthMode] = useState('login'); // 'login' or 'signup'
-  const [activeComponent, setActiveComponent] = useState('upi-checker');
+  const [activeComponent, setActiveComponent] = useState(DEFAULT_VIEW);
+  const [, setViewReloads] = useState(0);
+
+  useEffect(() => {
+    // Fetch the first view while authentication is still being checked
+    prefetchView(DEFAULT_VIEW);
+  }, []);
+
+  useEffect(() => {
+    if (!user) return;
+    return whenIdle(() => IDLE_PREFETCH_VIEWS.forEach(prefetchView));
+  }, [user]);
 
   useEffect(() => {
     // Check for demo user first
@@ -38,19 +84,33 @@ function App() {
       }
     }
     
-    // Try Firebase authentication
-    try {
-      const unsubscribe = onAuthStateChanged(auth, (user) => {
-        if (!demoUserLoggedIn) {
-          setUser(user);
-        }
-        setLoading(false);
-      });
-      return () => unsubscribe();
-    } catch (firebaseError) {
-      console.warn('Firebase not configured');
+    if (!isFirebaseConfigured) {
       setLoading(false);
+      return;
     }
+
+    // Try Firebase authentication (the SDK is only loaded here)
+    let cancelled = false;
+    let unsubscribe = null;
+    getFirebaseAuth()
+      .then((auth) => {
+        if (cancelled) return;
+        unsubscribe = auth.onAuthStateChanged((user) => {
+          if (!demoUserLoggedIn) {
+            setUser(user);
+          }
+          setLoading(false);
+        });
+      })
+      .catch((firebaseError) => {
+        console.warn('Firebase not configured', firebaseError);
+        setLoading(false);
+      });
+
+    return () => {
+      cancelled = true;
+      if (unsubscribe) unsubscribe();
+    };
   }, []);
 
   const handleLogin = (user) => {
@@ -63,32 +123,34 @@ function App() {
 
   const handleLogout = () => {
     // Clear demo user data
+    const demoSession = localStorage.getItem('demoUserLoggedIn') === 'true';
     localStorage.removeItem('demoUser');
     localStorage.removeItem('demoUserLoggedIn');
     
-    // Try Firebase signOut
-    try {
-      auth.signOut();
-    } catch (error) {
-      console.warn('Firebase not configured');
+    // Try Firebase signOut; demo sessions never loaded it
+    if (isFirebaseConfigured && !demoSession) {
+      getFirebaseAuth()
+        .then((auth) => auth.signOut())
+        .catch(() => console.warn('Firebase not configured'));
     }
     
     setUser(null);
-    setActiveComponent('upi-checker');
+    setActiveComponent(DEFAULT_VIEW);
+  };
+
+  const viewKey = views[activeComponent] ? activeComponent : DEFAULT_VIEW;
+
+  const retryView = () => {
+    reloadView(viewKey);
+    setViewReloads(count => count + 1);
   };
 
   const renderComponent = () => {
-    switch (activeComponent) {
-      case 'upi-checker': return <UpiChecker />;
-      case 'qr-scanner': return <QrScanner />;
-      case 'phone-checker': return <PhoneChecker />;
-      case 'link-checker': return <LinkChecker />;
-      case 'fraud-reporting': return <FraudReporting />;
-      case 'fraud-database': return <FraudDatabase />;
-      case 'chat-support': return <ChatSupport />;
-      case 'profile': return <UserProfile user={user} onLogout={handleLogout} />;
-      default: return <UpiChecker />;
+    const View = views[viewKey];
+    if (activeComponent === 'profile') {
+      return <View user={user} onLogout={handleLogout} />;
     }
+    return <View />;
   };
 
   if (loading) {
@@ -134,10 +196,20 @@ function App() {
         <SlidingNavigation 
           activeComponent={activeComponent}
           onComponentChange={setActiveComponent}
+          onPrefetch={prefetchView}
         />
         
         <main className="app-content">
-          {renderComponent()}
+          <ViewErrorBoundary viewKey={viewKey} onRetry={retryView}>
+            <Suspense fallback={
+              <div className="loading">
+                <div className="loading-spinner"></div>
+                Loading...
+              </div>
+            }>
+              {renderComponent()}
+            </Suspense>
+          </ViewErrorBoundary>
         </main>
       </div>
     </div>
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef, memo } from 'react';
 import { 
   Database, 
   Search, 
@@ -15,104 +15,350 @@ import {
   RefreshCw
 } from 'lucide-react';
 import fraudDB from '../services/fraudDatabase';
+import VirtualList from './VirtualList';
+
+const HOUR_MS = 1000 * 60 * 60;
+
+// Wait this long after the last keystroke or filter change before searching
+const SEARCH_DEBOUNCE_MS = 300;
+
+// Trend periods for the statistics tab, each read from the matching rollups
+const trendRanges = [
+  { value: '24h', label: 'Last 24 hours', duration: HOUR_MS * 24, granularity: 'hour' },
+  { value: '7d', label: 'Last 7 days', duration: HOUR_MS * 24 * 7, granularity: 'day' },
+  { value: '30d', label: 'Last 30 days', duration: HOUR_MS * 24 * 30, granularity: 'day' },
+  { value: '12w', label: 'Last 12 weeks', duration: HOUR_MS * 24 * 7 * 12, granularity: 'week' }
+];
+
+// Leaderboard orderings offered in the statistics tab
+const leaderboards = [
+  { value: 'risk', label: 'Highest risk' },
+  { value: 'reports', label: 'Most reported' },
+  { value: 'amount', label: 'Most money lost' }
+];
+
+const formatTimeAgo = (timestamp) => {
+  const now = Date.now();
+  const diff = now - timestamp;
+  const minutes = Math.floor(diff / (1000 * 60));
+  const hours = Math.floor(diff / (1000 * 60 * 60));
+  const days = Math.floor(diff / (1000 * 60 * 60 * 24));
+
+  if (minutes < 1) return 'Just now';
+  if (minutes < 60) return `${minutes}m ago`;
+  if (hours < 24) return `${hours}h ago`;
+  return `${days}d ago`;
+};
+
+const formatCurrency = (amount) => {
+  if (!amount) return 'Not specified';
+  return `₹${amount.toLocaleString('en-IN')}`;
+};
+
+const getIdentifierIcon = (type) => {
+  switch (type) {
+    case 'phone': return <Phone size={16} />;
+    case 'link': return <LinkIcon size={16} />;
+    default: return <CreditCard size={16} />;
+  }
+};
+
+const getSeverityColor = (severity) => {
+  if (severity >= 4) return '#EF4444';
+  if (severity === 3) return '#F59E0B';
+  return '#10B981';
+};
+
+const getSeverityLabel = (severity) => {
+  if (severity >= 4) return 'High Risk';
+  if (severity === 3) return 'Moderate';
+  return 'Low Risk';
+};
+
+const getCategoryLabel = (category) => {
+  const labels = {
+    'phishing': 'Phishing',
+    'payment_fraud': 'Payment Fraud',
+    'phone_fraud': 'Phone Scam',
+    'fake_merchant': 'Fake Merchant',
+    'link_fraud': 'Malicious Link',
+    'other': 'Other Fraud'
+  };
+  return labels[category] || category;
+};
+
+const getCategoryIcon = (category) => {
+  const icons = {
+    'phishing': '🎣',
+    'payment_fraud': '💳',
+    'phone_fraud': '📞',
+    'fake_merchant': '🏪',
+    'link_fraud': '🔗',
+    'other': '⚠️'
+  };
+  return icons[category] || '⚠️';
+};
+
+// One report in the list; memoized so rows re-render only when their report changes
+const ReportCard = memo(({ report }) => (
+  <div className="card" style={{ padding: '1rem', margin: 0 }}>
+    <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'flex-start', marginBottom: '1rem' }}>
+      <div style={{ display: 'flex', alignItems: 'center', gap: '0.5rem' }}>
+        <span style={{ fontSize: '1.25rem' }}>
+          {getCategoryIcon(report.category)}
+        </span>
+        <div>
+          <h4 style={{ margin: 0, color: '#1F2937', fontSize: '1rem' }}>
+            {getCategoryLabel(report.category)}
+          </h4>
+          <div style={{ display: 'flex', alignItems: 'center', gap: '0.5rem', marginTop: '0.25rem' }}>
+            <Clock size={14} color="#6B7280" />
+            <span style={{ fontSize: '0.8rem', color: '#6B7280' }}>
+              {formatTimeAgo(report.timestamp)}
+            </span>
+            {report.verified && (
+              <span style={{ 
+                fontSize: '0.7rem', 
+                background: '#10B981', 
+                color: 'white',
+                padding: '0.1rem 0.4rem',
+                borderRadius: '0.25rem'
+              }}>
+                Verified
+              </span>
+            )}
+          </div>
+        </div>
+      </div>
+
+      <div style={{ 
+        padding: '0.25rem 0.5rem',
+        background: `${getSeverityColor(report.severity)}20`,
+        color: getSeverityColor(report.severity),
+        borderRadius: '0.25rem',
+        fontSize: '0.75rem',
+        fontWeight: '600'
+      }}>
+        {getSeverityLabel(report.severity)} ({report.severity}/5)
+      </div>
+    </div>
+
+    <div style={{ 
+      display: 'flex', 
+      alignItems: 'center', 
+      gap: '0.5rem',
+      padding: '0.5rem',
+      background: 'rgba(59, 130, 246, 0.05)',
+      borderRadius: '0.5rem',
+      marginBottom: '0.75rem'
+    }}>
+      {getIdentifierIcon(report.identifierType)}
+      <span style={{ fontWeight: '600', color: '#1F2937', fontSize: '0.9rem' }}>
+        Target:
+      </span>
+      <span style={{ 
+        color: '#3B82F6', 
+        fontFamily: 'monospace',
+        fontSize: '0.85rem'
+      }}>
+        {report.displayIdentifier}
+      </span>
+    </div>
+
+    <p style={{ 
+      margin: 0, 
+      color: '#4B5563', 
+      lineHeight: '1.5',
+      fontSize: '0.9rem',
+      marginBottom: '1rem'
+    }}>
+      {report.description}
+    </p>
+
+    <div style={{ 
+      display: 'grid',
+      gridTemplateColumns: 'repeat(auto-fit, minmax(120px, 1fr))',
+      gap: '1rem'
+    }}>
+      {report.amount && (
+        <div style={{ 
+          display: 'flex', 
+          alignItems: 'center', 
+          gap: '0.5rem'
+        }}>
+          <DollarSign size={16} color="#DC2626" />
+          <div>
+            <div style={{ fontSize: '0.75rem', color: '#6B7280' }}>Amount Lost</div>
+            <div style={{ fontSize: '0.9rem', fontWeight: '600', color: '#DC2626' }}>
+              {formatCurrency(report.amount)}
+            </div>
+          </div>
+        </div>
+      )}
+
+      <div style={{ 
+        display: 'flex', 
+        alignItems: 'center', 
+        gap: '0.5rem'
+      }}>
+        <Users size={16} color="#6B7280" />
+        <div>
+          <div style={{ fontSize: '0.75rem', color: '#6B7280' }}>Reported By</div>
+          <div style={{ fontSize: '0.8rem', color: '#4B5563' }}>
+            {report.reportedBy || 'Anonymous'}
+          </div>
+        </div>
+      </div>
+    </div>
+
+    <div style={{
+      marginTop: '0.75rem',
+      paddingTop: '0.75rem',
+      borderTop: '1px solid rgba(0, 0, 0, 0.05)',
+      fontSize: '0.75rem',
+      color: '#9CA3AF',
+      display: 'flex',
+      justifyContent: 'space-between',
+      alignItems: 'center'
+    }}>
+      <span>ID: {report.id}</span>
+      <span>
+        {new Date(report.timestamp).toLocaleDateString('en-IN', {
+          year: 'numeric',
+          month: 'short',
+          day: 'numeric',
+          hour: '2-digit',
+          minute: '2-digit'
+        })}
+      </span>
+    </div>
+  </div>
+));
+
+const getReportKey = (report) => report.id;
+const renderReport = (report) => <ReportCard report={report} />;
 
 const FraudDatabase = () => {
   const [reports, setReports] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [statistics, setStatistics] = useState({});
   const [loading, setLoading] = useState(true);
   const [searchQuery, setSearchQuery] = useState('');
   const [categoryFilter, setCategoryFilter] = useState('');
   const [riskFilter, setRiskFilter] = useState('');
   const [activeTab, setActiveTab] = useState('reports');
+  const [trendRange, setTrendRange] = useState('7d');
+  const [trends, setTrends] = useState([]);
+  const [leaderboardBy, setLeaderboardBy] = useState('risk');
+  const [leaderboard, setLeaderboard] = useState([]);
+  const [reloadKey, setReloadKey] = useState(0);
 
-  useEffect(() => {
-    loadData();
-  }, [searchQuery, categoryFilter, riskFilter]);
+  // Incremented per search; results from any earlier search are dropped
+  const searchSequence = useRef(0);
 
-  const loadData = () => {
+  // Debounced search: each change cancels the pending or in-flight search
+  useEffect(() => {
+    const sequence = ++searchSequence.current;
+    const controller = new AbortController();
     setLoading(true);
-    
-    // Simulate loading delay for better UX
-    setTimeout(() => {
-      let filteredReports;
-      
-      if (searchQuery || categoryFilter || riskFilter) {
-        filteredReports = fraudDB.searchReports(searchQuery, categoryFilter || null, riskFilter || null);
-      } else {
-        filteredReports = fraudDB.getRecentReports(100);
+
+    const timer = setTimeout(async () => {
+      try {
+        let filteredReports;
+        let cursor = null;
+
+        if (searchQuery || categoryFilter || riskFilter) {
+          filteredReports = await fraudDB.searchReports(
+            searchQuery, categoryFilter || null, riskFilter || null, undefined, { signal: controller.signal }
+          );
+        } else {
+          const page = await fraudDB.getReportsPage(100);
+          filteredReports = page.reports;
+          cursor = page.nextCursor;
+        }
+
+        if (sequence !== searchSequence.current) return;
+        setReports(filteredReports);
+        setNextCursor(cursor);
+        setLoading(false);
+      } catch (error) {
+        if (error.name === 'AbortError') return;
+        console.error('Error searching fraud reports:', error);
+        if (sequence === searchSequence.current) setLoading(false);
       }
-      
-      setReports(filteredReports);
-      setStatistics(fraudDB.getStatistics());
-      setLoading(false);
-    }, 300);
-  };
+    }, SEARCH_DEBOUNCE_MS);
 
-  const refreshData = () => {
-    fraudDB.updateReportsFeed();
-    loadData();
-  };
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [searchQuery, categoryFilter, riskFilter, reloadKey]);
 
-  const formatTimeAgo = (timestamp) => {
-    const now = Date.now();
-    const diff = now - timestamp;
-    const minutes = Math.floor(diff / (1000 * 60));
-    const hours = Math.floor(diff / (1000 * 60 * 60));
-    const days = Math.floor(diff / (1000 * 60 * 60 * 24));
-
-    if (minutes < 1) return 'Just now';
-    if (minutes < 60) return `${minutes}m ago`;
-    if (hours < 24) return `${hours}h ago`;
-    return `${days}d ago`;
-  };
+  // Statistics don't depend on the search, so they load only on mount and refresh
+  useEffect(() => {
+    let cancelled = false;
+    fraudDB.getStatistics().then(stats => {
+      if (!cancelled) setStatistics(stats);
+    }).catch(error => {
+      console.error('Error loading fraud statistics:', error);
+    });
+    return () => { cancelled = true; };
+  }, [reloadKey]);
 
-  const formatCurrency = (amount) => {
-    if (!amount) return 'Not specified';
-    return `₹${amount.toLocaleString('en-IN')}`;
-  };
+  useEffect(() => {
+    if (activeTab !== 'statistics') return;
+
+    let cancelled = false;
+    const { duration, granularity } = trendRanges.find(range => range.value === trendRange);
+    fraudDB.getTrends({ from: Date.now() - duration }, granularity).then(buckets => {
+      if (!cancelled) setTrends(buckets);
+    }).catch(error => {
+      console.error('Error loading fraud trends:', error);
+    });
+    return () => { cancelled = true; };
+  }, [activeTab, trendRange, statistics]);
 
-  const getIdentifierIcon = (type) => {
-    switch (type) {
-      case 'phone': return <Phone size={16} />;
-      case 'link': return <LinkIcon size={16} />;
-      default: return <CreditCard size={16} />;
+  useEffect(() => {
+    if (activeTab !== 'statistics') return;
+
+    let cancelled = false;
+    fraudDB.getLeaderboard(leaderboardBy, 10).then(entries => {
+      if (!cancelled) setLeaderboard(entries);
+    }).catch(error => {
+      console.error('Error loading fraud leaderboard:', error);
+    });
+    return () => { cancelled = true; };
+  }, [activeTab, leaderboardBy, statistics]);
+
+  const loadOlderReports = async () => {
+    const sequence = searchSequence.current;
+    setLoadingMore(true);
+    try {
+      const page = await fraudDB.getReportsPage(100, nextCursor);
+
+      // A new search replaced the list while this page was loading
+      if (sequence !== searchSequence.current) return;
+      setReports(prev => [...prev, ...page.reports]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Error loading older fraud reports:', error);
+    } finally {
+      setLoadingMore(false);
     }
   };
 
-  const getSeverityColor = (severity) => {
-    if (severity >= 4) return '#EF4444';
-    if (severity === 3) return '#F59E0B';
-    return '#10B981';
-  };
-
-  const getSeverityLabel = (severity) => {
-    if (severity >= 4) return 'High Risk';
-    if (severity === 3) return 'Moderate';
-    return 'Low Risk';
-  };
+  // Reports are stored with their feed fields, so a refresh only reloads them
+  const refreshData = () => setReloadKey(key => key + 1);
 
-  const getCategoryLabel = (category) => {
-    const labels = {
-      'phishing': 'Phishing',
-      'payment_fraud': 'Payment Fraud',
-      'phone_fraud': 'Phone Scam',
-      'fake_merchant': 'Fake Merchant',
-      'link_fraud': 'Malicious Link',
-      'other': 'Other Fraud'
-    };
-    return labels[category] || category;
-  };
-
-  const getCategoryIcon = (category) => {
-    const icons = {
-      'phishing': '🎣',
-      'payment_fraud': '💳',
-      'phone_fraud': '📞',
-      'fake_merchant': '🏪',
-      'link_fraud': '🔗',
-      'other': '⚠️'
-    };
-    return icons[category] || '⚠️';
+  const formatBucket = (start) => {
+    const { granularity } = trendRanges.find(range => range.value === trendRange);
+    const date = new Date(start);
+    if (granularity === 'hour') {
+      return date.toLocaleTimeString('en-IN', { hour: '2-digit', minute: '2-digit' });
+    }
+    const day = date.toLocaleDateString('en-IN', { month: 'short', day: 'numeric' });
+    return granularity === 'week' ? `Week of ${day}` : day;
   };
 
   const categories = [
@@ -125,6 +371,8 @@ const FraudDatabase = () => {
     { value: 'other', label: 'Other' }
   ];
 
+  const trendPeak = Math.max(1, ...trends.map(bucket => bucket.count));
+
   const riskLevels = [
     { value: '', label: 'All Risk Levels' },
     { value: 'high', label: 'High Risk (4-5)' },
@@ -257,140 +505,22 @@ const FraudDatabase = () => {
               </div>
             ) : (
               <div style={{ display: 'flex', flexDirection: 'column', gap: '1rem' }}>
-                {reports.map((report) => (
-                  <div key={report.id} className="card" style={{ padding: '1rem', margin: 0 }}>
-                    <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'flex-start', marginBottom: '1rem' }}>
-                      <div style={{ display: 'flex', alignItems: 'center', gap: '0.5rem' }}>
-                        <span style={{ fontSize: '1.25rem' }}>
-                          {getCategoryIcon(report.category)}
-                        </span>
-                        <div>
-                          <h4 style={{ margin: 0, color: '#1F2937', fontSize: '1rem' }}>
-                            {getCategoryLabel(report.category)}
-                          </h4>
-                          <div style={{ display: 'flex', alignItems: 'center', gap: '0.5rem', marginTop: '0.25rem' }}>
-                            <Clock size={14} color="#6B7280" />
-                            <span style={{ fontSize: '0.8rem', color: '#6B7280' }}>
-                              {formatTimeAgo(report.timestamp)}
-                            </span>
-                            {report.verified && (
-                              <span style={{ 
-                                fontSize: '0.7rem', 
-                                background: '#10B981', 
-                                color: 'white',
-                                padding: '0.1rem 0.4rem',
-                                borderRadius: '0.25rem'
-                              }}>
-                                Verified
-                              </span>
-                            )}
-                          </div>
-                        </div>
-                      </div>
-
-                      <div style={{ 
-                        padding: '0.25rem 0.5rem',
-                        background: `${getSeverityColor(report.severity)}20`,
-                        color: getSeverityColor(report.severity),
-                        borderRadius: '0.25rem',
-                        fontSize: '0.75rem',
-                        fontWeight: '600'
-                      }}>
-                        {getSeverityLabel(report.severity)} ({report.severity}/5)
-                      </div>
-                    </div>
-
-                    <div style={{ 
-                      display: 'flex', 
-                      alignItems: 'center', 
-                      gap: '0.5rem',
-                      padding: '0.5rem',
-                      background: 'rgba(59, 130, 246, 0.05)',
-                      borderRadius: '0.5rem',
-                      marginBottom: '0.75rem'
-                    }}>
-                      {getIdentifierIcon(report.identifierType)}
-                      <span style={{ fontWeight: '600', color: '#1F2937', fontSize: '0.9rem' }}>
-                        Target:
-                      </span>
-                      <span style={{ 
-                        color: '#3B82F6', 
-                        fontFamily: 'monospace',
-                        fontSize: '0.85rem'
-                      }}>
-                        {report.displayIdentifier}
-                      </span>
-                    </div>
-
-                    <p style={{ 
-                      margin: 0, 
-                      color: '#4B5563', 
-                      lineHeight: '1.5',
-                      fontSize: '0.9rem',
-                      marginBottom: '1rem'
-                    }}>
-                      {report.description}
-                    </p>
-
-                    <div style={{ 
-                      display: 'grid',
-                      gridTemplateColumns: 'repeat(auto-fit, minmax(120px, 1fr))',
-                      gap: '1rem'
-                    }}>
-                      {report.amount && (
-                        <div style={{ 
-                          display: 'flex', 
-                          alignItems: 'center', 
-                          gap: '0.5rem'
-                        }}>
-                          <DollarSign size={16} color="#DC2626" />
-                          <div>
-                            <div style={{ fontSize: '0.75rem', color: '#6B7280' }}>Amount Lost</div>
-                            <div style={{ fontSize: '0.9rem', fontWeight: '600', color: '#DC2626' }}>
-                              {formatCurrency(report.amount)}
-                            </div>
-                          </div>
-                        </div>
-                      )}
-
-                      <div style={{ 
-                        display: 'flex', 
-                        alignItems: 'center', 
-                        gap: '0.5rem'
-                      }}>
-                        <Users size={16} color="#6B7280" />
-                        <div>
-                          <div style={{ fontSize: '0.75rem', color: '#6B7280' }}>Reported By</div>
-                          <div style={{ fontSize: '0.8rem', color: '#4B5563' }}>
-                            {report.reportedBy || 'Anonymous'}
-                          </div>
-                        </div>
-                      </div>
-                    </div>
+                <VirtualList
+                  items={reports}
+                  getKey={getReportKey}
+                  renderItem={renderReport}
+                  estimatedHeight={260}
+                />
 
-                    <div style={{
-                      marginTop: '0.75rem',
-                      paddingTop: '0.75rem',
-                      borderTop: '1px solid rgba(0, 0, 0, 0.05)',
-                      fontSize: '0.75rem',
-                      color: '#9CA3AF',
-                      display: 'flex',
-                      justifyContent: 'space-between',
-                      alignItems: 'center'
-                    }}>
-                      <span>ID: {report.id}</span>
-                      <span>
-                        {new Date(report.timestamp).toLocaleDateString('en-IN', {
-                          year: 'numeric',
-                          month: 'short',
-                          day: 'numeric',
-                          hour: '2-digit',
-                          minute: '2-digit'
-                        })}
-                      </span>
-                    </div>
-                  </div>
-                ))}
+                {nextCursor && (
+                  <button
+                    onClick={loadOlderReports}
+                    className="btn btn-secondary"
+                    disabled={loadingMore}
+                  >
+                    {loadingMore ? 'Loading...' : 'Load older reports'}
+                  </button>
+                )}
               </div>
             )}
           </>
@@ -445,6 +575,120 @@ const FraudDatabase = () => {
               </div>
             </div>
 
+            {/* Report Trends */}
+            <div className="card" style={{ padding: '1.5rem', marginBottom: '1.5rem' }}>
+              <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', marginBottom: '1rem', gap: '1rem' }}>
+                <h3 style={{ color: '#1F2937', margin: 0 }}>Report Trends</h3>
+                <select
+                  className="form-select"
+                  value={trendRange}
+                  onChange={(e) => setTrendRange(e.target.value)}
+                  style={{ maxWidth: '180px' }}
+                >
+                  {trendRanges.map(range => (
+                    <option key={range.value} value={range.value}>
+                      {range.label}
+                    </option>
+                  ))}
+                </select>
+              </div>
+
+              <div style={{ display: 'flex', gap: '1.5rem', marginBottom: '1rem', fontSize: '0.9rem', color: '#6B7280' }}>
+                <span>
+                  <strong style={{ color: '#1F2937' }}>{trends.reduce((sum, bucket) => sum + bucket.count, 0)}</strong> reports
+                </span>
+                <span>
+                  <strong style={{ color: '#DC2626' }}>
+                    ₹{trends.reduce((sum, bucket) => sum + bucket.amount, 0).toLocaleString('en-IN')}
+                  </strong> lost
+                </span>
+              </div>
+
+              <div style={{ display: 'flex', alignItems: 'flex-end', gap: '2px', height: '120px' }}>
+                {trends.map(bucket => (
+                  <div
+                    key={bucket.start}
+                    title={`${formatBucket(bucket.start)}: ${bucket.count} reports, ₹${bucket.amount.toLocaleString('en-IN')}`}
+                    style={{
+                      flex: 1,
+                      height: `${(bucket.count / trendPeak) * 100}%`,
+                      minHeight: bucket.count ? '4px' : '1px',
+                      background: bucket.avgSeverity >= 4 ? '#EF4444' : bucket.avgSeverity >= 3 ? '#F59E0B' : '#3B82F6',
+                      borderRadius: '2px 2px 0 0',
+                      opacity: bucket.count ? 1 : 0.3
+                    }}
+                  />
+                ))}
+              </div>
+
+              {trends.length > 0 && (
+                <div style={{ display: 'flex', justifyContent: 'space-between', marginTop: '0.5rem', fontSize: '0.75rem', color: '#9CA3AF' }}>
+                  <span>{formatBucket(trends[0].start)}</span>
+                  <span>{formatBucket(trends[trends.length - 1].start)}</span>
+                </div>
+              )}
+            </div>
+
+            {/* Most Dangerous Payees */}
+            <div className="card" style={{ padding: '1.5rem', marginBottom: '1.5rem' }}>
+              <div style={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', marginBottom: '1rem', gap: '1rem' }}>
+                <h3 style={{ color: '#1F2937', margin: 0 }}>Most Dangerous Payees</h3>
+                <select
+                  className="form-select"
+                  value={leaderboardBy}
+                  onChange={(e) => setLeaderboardBy(e.target.value)}
+                  style={{ maxWidth: '180px' }}
+                >
+                  {leaderboards.map(option => (
+                    <option key={option.value} value={option.value}>
+                      {option.label}
+                    </option>
+                  ))}
+                </select>
+              </div>
+
+              <div style={{ display: 'flex', flexDirection: 'column', gap: '0.5rem' }}>
+                {leaderboard.map((entry, i) => (
+                  <div key={entry.identifier} style={{
+                    display: 'flex',
+                    justifyContent: 'space-between',
+                    alignItems: 'center',
+                    gap: '0.75rem',
+                    padding: '0.75rem',
+                    background: 'rgba(0, 0, 0, 0.02)',
+                    borderRadius: '0.5rem'
+                  }}>
+                    <div style={{ display: 'flex', alignItems: 'center', gap: '0.75rem', minWidth: 0 }}>
+                      <span style={{ fontWeight: 'bold', color: '#9CA3AF', width: '1.5rem' }}>#{i + 1}</span>
+                      {getIdentifierIcon(entry.identifierType)}
+                      <span style={{
+                        color: '#1F2937',
+                        fontFamily: 'monospace',
+                        fontSize: '0.85rem',
+                        overflow: 'hidden',
+                        textOverflow: 'ellipsis',
+                        whiteSpace: 'nowrap'
+                      }}>
+                        {entry.displayIdentifier}
+                      </span>
+                    </div>
+                    <div style={{ textAlign: 'right', flexShrink: 0 }}>
+                      <div style={{ fontWeight: '600', color: entry.riskLevel === 'danger' ? '#EF4444' : entry.riskLevel === 'moderate' ? '#F59E0B' : '#10B981' }}>
+                        {leaderboardBy === 'amount'
+                          ? `₹${entry.totalAmount.toLocaleString('en-IN')}`
+                          : leaderboardBy === 'reports'
+                            ? `${entry.reportCount} reports`
+                            : `Score ${entry.safetyScore}/100`}
+                      </div>
+                      <div style={{ fontSize: '0.8rem', color: '#6B7280' }}>
+                        {entry.reportCount} reports · {formatTimeAgo(entry.lastReported)}
+                      </div>
+                    </div>
+                  </div>
+                ))}
+              </div>
+            </div>
+
             {/* Risk Level Distribution */}
             <div className="card" style={{ padding: '1.5rem', marginBottom: '1.5rem' }}>
               <h3 style={{ color: '#1F2937', marginBottom: '1rem' }}>Risk Level Distribution</h3>
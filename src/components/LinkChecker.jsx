@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { Link as LinkIcon, Shield, AlertTriangle, CheckCircle, Send, Users, Clock, ExternalLink } from 'lucide-react';
 import { reportFraud, checkUpiSafety } from '../services/firebaseService';
+import { linkIdentifier } from '../services/fraudDatabaseApi';
 
 const LinkChecker = () => {
   const [activeTab, setActiveTab] = useState('check');
@@ -47,11 +48,6 @@ const LinkChecker = () => {
     }
   };
 
-  const normalizePaymentLink = (link) => {
-    // Create a hash of the link for database storage
-    return link.toLowerCase().trim();
-  };
-
   const getDomainFromLink = (link) => {
     try {
       const url = new URL(link);
@@ -80,9 +76,7 @@ const LinkChecker = () => {
     setResult(null);
 
     try {
-      const normalizedLink = normalizePaymentLink(paymentLink);
-      const linkHash = btoa(normalizedLink).replace(/[^a-zA-Z0-9]/g, '_');
-      const safetyResult = await checkUpiSafety(`link_${linkHash}`);
+      const safetyResult = await checkUpiSafety(linkIdentifier(paymentLink));
       setResult({
         ...safetyResult,
         originalLink: paymentLink,
@@ -112,8 +106,6 @@ const LinkChecker = () => {
     setError('');
 
     try {
-      const normalizedLink = normalizePaymentLink(reportData.link);
-      const linkHash = btoa(normalizedLink).replace(/[^a-zA-Z0-9]/g, '_');
       const fraudData = {
         description: reportData.description.trim(),
         amount: reportData.amount ? parseFloat(reportData.amount) : null,
@@ -124,7 +116,7 @@ const LinkChecker = () => {
         reportedFrom: 'link_checker'
       };
 
-      await reportFraud(`link_${linkHash}`, fraudData);
+      await reportFraud(linkIdentifier(reportData.link), fraudData);
       setReportSuccess(true);
       setReportData({
         link: '',
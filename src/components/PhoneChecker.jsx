@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { Phone, Shield, AlertTriangle, CheckCircle, Send, Users, Clock } from 'lucide-react';
 import { reportFraud, checkUpiSafety } from '../services/firebaseService';
+import { isPhoneNumber, normalizePhoneNumber, phoneIdentifier } from '../services/fraudDatabaseApi';
 
 const PhoneChecker = () => {
   const [activeTab, setActiveTab] = useState('check');
@@ -18,26 +19,13 @@ const PhoneChecker = () => {
   const [reportLoading, setReportLoading] = useState(false);
   const [reportSuccess, setReportSuccess] = useState(false);
 
-  const validatePhoneNumber = (phone) => {
-    const phonePattern = /^(\+91|91|0)?[6-9]\d{9}$/;
-    return phonePattern.test(phone.replace(/\s+/g, ''));
-  };
-
-  const normalizePhoneNumber = (phone) => {
-    const cleaned = phone.replace(/\s+/g, '');
-    if (cleaned.startsWith('+91')) return cleaned.slice(3);
-    if (cleaned.startsWith('91')) return cleaned.slice(2);
-    if (cleaned.startsWith('0')) return cleaned.slice(1);
-    return cleaned;
-  };
-
   const handleCheck = async () => {
     if (!phoneNumber.trim()) {
       setError('Please enter a phone number');
       return;
     }
 
-    if (!validatePhoneNumber(phoneNumber)) {
+    if (!isPhoneNumber(phoneNumber)) {
       setError('Please enter a valid Indian phone number');
       return;
     }
@@ -48,7 +36,7 @@ const PhoneChecker = () => {
 
     try {
       const normalizedPhone = normalizePhoneNumber(phoneNumber);
-      const safetyResult = await checkUpiSafety(`phone_${normalizedPhone}`);
+      const safetyResult = await checkUpiSafety(phoneIdentifier(phoneNumber));
       setResult({
         ...safetyResult,
         phoneNumber: normalizedPhone,
@@ -69,7 +57,7 @@ const PhoneChecker = () => {
       return;
     }
 
-    if (!validatePhoneNumber(reportData.phoneNumber)) {
+    if (!isPhoneNumber(reportData.phoneNumber)) {
       setError('Please enter a valid Indian phone number');
       return;
     }
@@ -88,7 +76,7 @@ const PhoneChecker = () => {
         reportedFrom: 'phone_checker'
       };
 
-      await reportFraud(`phone_${normalizedPhone}`, fraudData);
+      await reportFraud(phoneIdentifier(reportData.phoneNumber), fraudData);
       setReportSuccess(true);
       setReportData({
         phoneNumber: '',
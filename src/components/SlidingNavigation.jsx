@@ -1,6 +1,6 @@
 import React from "react";
 
-function SlidingNavigation({ activeComponent, onComponentChange }) {
+function SlidingNavigation({ activeComponent, onComponentChange, onPrefetch = () => {} }) {
   const navItems = [
     { key: "upi-checker", label: "UPI Checker" },
     { key: "qr-scanner", label: "QR Scanner" },
@@ -27,6 +27,9 @@ function SlidingNavigation({ activeComponent, onComponentChange }) {
                 activeComponent === item.key ? "active" : ""
               }`}
               onClick={() => onComponentChange(item.key)}
+              onMouseEnter={() => onPrefetch(item.key)}
+              onFocus={() => onPrefetch(item.key)}
+              onTouchStart={() => onPrefetch(item.key)}
             >
               {item.label}
             </button>
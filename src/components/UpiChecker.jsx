@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import { Shield, AlertTriangle, CheckCircle, Clock, Users, ExternalLink } from 'lucide-react';
 import { checkUpiSafety } from '../services/firebaseService';
 
@@ -8,6 +8,11 @@ const UpiChecker = () => {
   const [result, setResult] = useState(null);
   const [error, setError] = useState('');
 
+  useEffect(() => {
+    // Read by the startup benchmark (scripts/bench-startup.js)
+    performance.mark('upi-checker-interactive');
+  }, []);
+
   const validateUpiId = (id) => {
     const upiPattern = /^[a-zA-Z0-9.\-_]{2,256}@[a-zA-Z]{2,64}$/;
     return upiPattern.test(id);
@@ -0,0 +1,48 @@
+import React from "react";
+
+// Catches a view that fails to load (e.g. its chunk can't be fetched after a
+// deploy or on a flaky connection) or throws while rendering, and offers a retry
+class ViewErrorBoundary extends React.Component {
+  constructor(props) {
+    super(props);
+    this.state = { error: null };
+  }
+
+  static getDerivedStateFromError(error) {
+    return { error };
+  }
+
+  componentDidCatch(error, info) {
+    console.error("Error loading view:", error, info.componentStack);
+  }
+
+  componentDidUpdate(prevProps) {
+    // Switching to another view clears the error
+    if (this.state.error && prevProps.viewKey !== this.props.viewKey) {
+      this.setState({ error: null });
+    }
+  }
+
+  handleRetry = () => {
+    this.props.onRetry();
+    this.setState({ error: null });
+  };
+
+  render() {
+    if (!this.state.error) {
+      return this.props.children;
+    }
+
+    return (
+      <div className="view-error">
+        <h3>This section couldn't be loaded</h3>
+        <p>Check your connection and try again.</p>
+        <button className="btn btn-primary" onClick={this.handleRetry}>
+          Try again
+        </button>
+      </div>
+    );
+  }
+}
+
+export default ViewErrorBoundary;
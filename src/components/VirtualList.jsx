@@ -0,0 +1,129 @@
+import React, { useState, useEffect, useLayoutEffect, useRef, useMemo, useCallback } from 'react';
+
+// First index whose span ends below `position` (offsets[i] is where item i starts)
+const findIndex = (offsets, position) => {
+  let low = 0;
+  let high = offsets.length - 1;
+  while (low < high) {
+    const mid = (low + high) >>> 1;
+    if (offsets[mid + 1] <= position) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+};
+
+// Positions one row and reports its rendered height whenever it changes
+const MeasuredRow = ({ itemKey, top, onResize, children }) => {
+  const ref = useRef(null);
+
+  useLayoutEffect(() => {
+    const node = ref.current;
+    const observer = new ResizeObserver(() => onResize(itemKey, node.offsetHeight));
+    observer.observe(node);
+    return () => observer.disconnect();
+  }, [itemKey, onResize]);
+
+  return (
+    <div
+      ref={ref}
+      style={{ position: 'absolute', top: 0, left: 0, right: 0, transform: `translateY(${top}px)` }}
+    >
+      {children}
+    </div>
+  );
+};
+
+// Window-scrolled list that mounts only the rows near the viewport. Rows are
+// laid out from their measured heights (estimatedHeight until first rendered).
+const VirtualList = ({ items, getKey, renderItem, estimatedHeight = 200, gap = 16, overscan = 800 }) => {
+  const containerRef = useRef(null);
+  const heights = useRef(new Map()); // item key -> measured height
+  const [layoutVersion, setLayoutVersion] = useState(0);
+  const [range, setRange] = useState({ start: 0, end: 10 });
+
+  const offsets = useMemo(() => {
+    const result = new Float64Array(items.length + 1);
+    for (let i = 0; i < items.length; i++) {
+      const height = heights.current.get(getKey(items[i])) ?? estimatedHeight;
+      result[i + 1] = result[i] + height + gap;
+    }
+    return result;
+  }, [items, getKey, estimatedHeight, gap, layoutVersion]);
+
+  const offsetsRef = useRef(offsets);
+  offsetsRef.current = offsets;
+
+  // Recompute the visible range from the container's position in the window
+  const updateRange = useCallback(() => {
+    const container = containerRef.current;
+    const currentOffsets = offsetsRef.current;
+    if (!container || currentOffsets.length < 2) {
+      setRange(prev => (prev.start === 0 && prev.end === 0 ? prev : { start: 0, end: 0 }));
+      return;
+    }
+
+    const top = -container.getBoundingClientRect().top;
+    const start = findIndex(currentOffsets, top - overscan);
+    const end = findIndex(currentOffsets, top + window.innerHeight + overscan) + 1;
+    setRange(prev => (prev.start === start && prev.end === end ? prev : { start, end }));
+  }, [overscan]);
+
+  useEffect(() => {
+    let frame = null;
+    const schedule = () => {
+      if (frame === null) {
+        frame = requestAnimationFrame(() => {
+          frame = null;
+          updateRange();
+        });
+      }
+    };
+
+    window.addEventListener('scroll', schedule, { passive: true });
+    window.addEventListener('resize', schedule);
+    return () => {
+      window.removeEventListener('scroll', schedule);
+      window.removeEventListener('resize', schedule);
+      if (frame !== null) cancelAnimationFrame(frame);
+    };
+  }, [updateRange]);
+
+  // New items or measurements move rows; recompute what is visible
+  useLayoutEffect(() => {
+    updateRange();
+  }, [offsets, updateRange]);
+
+  // Batch height changes from many rows into one relayout per frame
+  const pendingLayout = useRef(null);
+  useEffect(() => () => cancelAnimationFrame(pendingLayout.current), []);
+  const handleResize = useCallback((key, height) => {
+    if (!height || heights.current.get(key) === height) return;
+    heights.current.set(key, height);
+    if (pendingLayout.current === null) {
+      pendingLayout.current = requestAnimationFrame(() => {
+        pendingLayout.current = null;
+        setLayoutVersion(version => version + 1);
+      });
+    }
+  }, []);
+
+  const visible = items.slice(range.start, Math.min(range.end, items.length));
+
+  return (
+    <div
+      ref={containerRef}
+      style={{ position: 'relative', height: Math.max(0, offsets[items.length] - gap) }}
+    >
+      {visible.map((item, i) => {
+        const key = getKey(item);
+        return (
+          <MeasuredRow key={key} itemKey={key} top={offsets[range.start + i]} onResize={handleResize}>
+            {renderItem(item)}
+          </MeasuredRow>
+        );
+      })}
+    </div>
+  );
+};
+
+export default VirtualList;
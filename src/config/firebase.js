@@ -1,7 +1,5 @@
-// Import the functions you need from the SDKs you need
-import { initializeApp } from 'firebase/app';
-import { getDatabase } from 'firebase/database';
-import { getAuth } from 'firebase/auth';
+// Firebase is loaded and initialized on first use, so demo and local-only
+// sessions never download or boot the SDK. Each getter caches its promise.
 
 // Firebase configuration using environment variables
 const firebaseConfig = {
@@ -14,10 +12,38 @@ const firebaseConfig = {
   appId: import.meta.env.VITE_FIREBASE_APP_ID || "demo-app-id"
 };
 
+// Without real credentials there is no Firebase session to restore
+export const isFirebaseConfigured = Boolean(import.meta.env.VITE_FIREBASE_API_KEY);
+
+// Cache a loader's promise, dropping it on failure so the next call retries
+const once = (load) => {
+  let promise = null;
+  return () => {
+    if (!promise) {
+      promise = load().catch(error => {
+        promise = null;
+        throw error;
+      });
+    }
+    return promise;
+  };
+};
+
 // Initialize Firebase
-const app = initializeApp(firebaseConfig);
+export const getFirebaseApp = once(async () => {
+  const { initializeApp } = await import('firebase/app');
+  return initializeApp(firebaseConfig);
+});
 
 // Initialize Firebase services
-export const database = getDatabase(app);
-export const auth = getAuth(app);
-export default app;
+export const getFirebaseAuth = once(async () => {
+  const [app, { getAuth }] = await Promise.all([getFirebaseApp(), import('firebase/auth')]);
+  return getAuth(app);
+});
+
+export const getFirebaseDatabase = once(async () => {
+  const [app, { getDatabase }] = await Promise.all([getFirebaseApp(), import('firebase/database')]);
+  return getDatabase(app);
+});
+
+export default getFirebaseApp;
@@ -0,0 +1,114 @@
+// Bloom Filter - compact probabilistic set of reported identifiers.
+// mightContain() never gives a false negative, so a miss proves an identifier
+// was never reported; a hit only means "look it up".
+
+// 32-bit FNV-1a over UTF-16 code units
+const fnv1a = (value) => {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < value.length; i++) {
+    hash ^= value.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+};
+
+// Second, independent hash (murmur3 finalizer over FNV with a different seed)
+const mix = (value) => {
+  let hash = 0x9747b28c;
+  for (let i = 0; i < value.length; i++) {
+    hash = Math.imul(hash ^ value.charCodeAt(i), 0x5bd1e995);
+    hash ^= hash >>> 15;
+  }
+  hash ^= hash >>> 16;
+  hash = Math.imul(hash, 0x85ebca6b);
+  hash ^= hash >>> 13;
+  return (hash >>> 0) | 1; // odd, so probes never repeat
+};
+
+export class BloomFilter {
+  constructor(capacity, falsePositiveRate = 0.01, { bits, hashes, count = 0, data } = {}) {
+    this.capacity = capacity;
+    this.falsePositiveRate = falsePositiveRate;
+    this.bits = bits || Math.max(64, Math.ceil(-capacity * Math.log(falsePositiveRate) / (Math.LN2 * Math.LN2)));
+    this.hashes = hashes || Math.max(1, Math.round((this.bits / capacity) * Math.LN2));
+    this.count = count;
+    this.data = data || new Uint8Array(Math.ceil(this.bits / 8));
+  }
+
+  // Build a filter sized for `values` plus room to grow
+  static from(values, falsePositiveRate = 0.01) {
+    const filter = new BloomFilter(Math.max(1024, values.length * 2), falsePositiveRate);
+    values.forEach(value => filter.add(value));
+    return filter;
+  }
+
+  // Restore a filter from toJSON() output (data as base64) or from the stored
+  // form (data as a Uint8Array)
+  static fromJSON({ capacity, falsePositiveRate, bits, hashes, count, data }) {
+    const bytes = typeof data === 'string'
+      ? Uint8Array.from(atob(data), char => char.charCodeAt(0))
+      : data;
+    return new BloomFilter(capacity, falsePositiveRate, { bits, hashes, count, data: bytes });
+  }
+
+  // Past capacity the false positive rate climbs; callers rebuild a larger filter
+  get isFull() {
+    return this.count > this.capacity;
+  }
+
+  positions(value, callback) {
+    const h1 = fnv1a(value);
+    const h2 = mix(value);
+    for (let i = 0; i < this.hashes; i++) {
+      callback((h1 + Math.imul(i, h2) >>> 0) % this.bits);
+    }
+  }
+
+  add(value) {
+    let added = false;
+    this.positions(value, (bit) => {
+      const mask = 1 << (bit & 7);
+      if (!(this.data[bit >> 3] & mask)) {
+        this.data[bit >> 3] |= mask;
+        added = true;
+      }
+    });
+    if (added) this.count++;
+  }
+
+  // Add every value in another filter of the same size; returns false (and
+  // changes nothing) when the two filters were built with different sizes
+  union(other) {
+    if (other.bits !== this.bits || other.hashes !== this.hashes) return false;
+    for (let i = 0; i < this.data.length; i++) {
+      this.data[i] |= other.data[i];
+    }
+    this.count = Math.max(this.count, other.count);
+    return true;
+  }
+
+  mightContain(value) {
+    let present = true;
+    this.positions(value, (bit) => {
+      if (!(this.data[bit >> 3] & (1 << (bit & 7)))) present = false;
+    });
+    return present;
+  }
+
+  // Form kept in IndexedDB (typed arrays are stored natively)
+  toStored() {
+    const { capacity, falsePositiveRate, bits, hashes, count, data } = this;
+    return { capacity, falsePositiveRate, bits, hashes, count, data };
+  }
+
+  // JSON form with base64 data, suitable for shipping as a static asset
+  toJSON() {
+    let binary = '';
+    for (let i = 0; i < this.data.length; i += 0x8000) {
+      binary += String.fromCharCode(...this.data.subarray(i, i + 0x8000));
+    }
+    return { ...this.toStored(), data: btoa(binary) };
+  }
+}
+
+export default BloomFilter;
@@ -0,0 +1,143 @@
+// Bulk Import - streaming NDJSON/CSV parsing of fraud report files
+
+// Report fields read from each row; anything else in an NDJSON row is kept as-is
+const NUMBER_FIELDS = ['amount', 'severity', 'timestamp'];
+
+// Accept a File/Blob or a ReadableStream of bytes
+const toByteStream = (source) => (typeof source.stream === 'function' ? source.stream() : source);
+
+// Yield decoded text lines from a byte stream, reporting bytes consumed so far
+export async function* readLines(source, onBytes = () => {}) {
+  let bytesRead = 0;
+  const counter = new TransformStream({
+    transform(chunk, controller) {
+      bytesRead += chunk.byteLength;
+      controller.enqueue(chunk);
+    }
+  });
+
+  const reader = toByteStream(source)
+    .pipeThrough(counter)
+    .pipeThrough(new TextDecoderStream())
+    .getReader();
+
+  let buffered = '';
+  try {
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+
+      buffered += value;
+      const lines = buffered.split(/\r?\n/);
+      buffered = lines.pop();
+      onBytes(bytesRead);
+      yield* lines;
+    }
+  } finally {
+    reader.releaseLock();
+  }
+
+  if (buffered) {
+    yield buffered;
+  }
+}
+
+// Split one CSV line into fields (quoted fields may contain commas and "" escapes,
+// but not line breaks)
+export const parseCsvLine = (line) => {
+  const fields = [];
+  let field = '';
+  let quoted = false;
+
+  for (let i = 0; i < line.length; i++) {
+    const char = line[i];
+    if (quoted) {
+      if (char === '"' && line[i + 1] === '"') {
+        field += '"';
+        i++;
+      } else if (char === '"') {
+        quoted = false;
+      } else {
+        field += char;
+      }
+    } else if (char === '"') {
+      quoted = true;
+    } else if (char === ',') {
+      fields.push(field);
+      field = '';
+    } else {
+      field += char;
+    }
+  }
+
+  fields.push(field);
+  return fields;
+};
+
+// Guess the format from a file name, defaulting to NDJSON
+export const detectFormat = (source) => {
+  const name = (source && source.name) || '';
+  return name.toLowerCase().endsWith('.csv') ? 'csv' : 'ndjson';
+};
+
+// Coerce a raw row into { identifier, reportData }, or null if it has no
+// identifier or a number field that isn't a finite number
+const toEntry = (row) => {
+  const { identifier, ...reportData } = row;
+  if (!identifier) return null;
+
+  for (const field of NUMBER_FIELDS) {
+    if (reportData[field] === '' || reportData[field] === undefined || reportData[field] === null) {
+      delete reportData[field];
+    } else {
+      reportData[field] = Number(reportData[field]);
+      if (!Number.isFinite(reportData[field])) return null;
+    }
+  }
+  // A blank id gets a generated one; others are kept so re-imports are skipped
+  if (reportData.id === '' || reportData.id === undefined || reportData.id === null) {
+    delete reportData.id;
+  } else {
+    reportData.id = String(reportData.id);
+  }
+  if (typeof reportData.verified === 'string') {
+    reportData.verified = reportData.verified.toLowerCase() === 'true';
+  }
+
+  return { identifier: String(identifier), reportData };
+};
+
+// Yield { identifier, reportData } entries from an NDJSON or CSV source.
+// CSV files need a header row naming the columns (identifier, description,
+// amount, severity, category, ...). Malformed rows are counted, not thrown.
+export async function* parseReports(source, { format = detectFormat(source), onBytes, onSkip = () => {} } = {}) {
+  let header = null;
+
+  for await (const line of readLines(source, onBytes)) {
+    if (!line.trim()) continue;
+
+    let row;
+    try {
+      if (format === 'csv') {
+        const fields = parseCsvLine(line);
+        if (!header) {
+          header = fields.map(field => field.trim());
+          continue;
+        }
+        row = Object.fromEntries(header.map((column, i) => [column, fields[i]]));
+      } else {
+        row = JSON.parse(line);
+      }
+    } catch {
+      onSkip(line);
+      continue;
+    }
+
+    const entry = row && typeof row === 'object' ? toEntry(row) : null;
+    if (entry) {
+      yield entry;
+    } else {
+      onSkip(line);
+    }
+  }
+}
@@ -0,0 +1,97 @@
+// Dictionary - string interning as small integer codes, and the compact
+// report encoding used by database snapshots
+
+// Interns values in first-seen order; code i is values[i]
+export class Dictionary {
+  constructor(values = []) {
+    this.values = [];
+    this.codes = new Map(); // value -> code
+    values.forEach(value => this.encode(value));
+  }
+
+  get size() {
+    return this.values.length;
+  }
+
+  encode(value) {
+    let code = this.codes.get(value);
+    if (code === undefined) {
+      code = this.values.length;
+      this.values.push(value);
+      this.codes.set(value, code);
+    }
+    return code;
+  }
+
+  decode(code) {
+    return this.values[code];
+  }
+}
+
+// Report fields written as plain values, then the fields interned as codes
+const PLAIN_FIELDS = ['id', 'timestamp', 'amount', 'severity', 'verified', 'description'];
+export const INTERNED_FIELDS = ['identifier', 'identifierType', 'displayIdentifier', 'category', 'reportedBy'];
+
+// Encodes reports as arrays: the plain fields, the interned fields' codes,
+// then an object of any other fields (null for missing values). Strings first
+// seen while encoding are collected so a writer can emit them ahead of the rows.
+export class ReportCodec {
+  constructor() {
+    this.dictionaries = Object.fromEntries(INTERNED_FIELDS.map(field => [field, new Dictionary()]));
+    this.flushed = Object.fromEntries(INTERNED_FIELDS.map(field => [field, 0]));
+  }
+
+  // Column layout, recorded in snapshot headers
+  static get fields() {
+    return [...PLAIN_FIELDS, ...INTERNED_FIELDS, 'extra'];
+  }
+
+  encode(report) {
+    const extra = { ...report };
+    const row = PLAIN_FIELDS.map(field => {
+      const value = extra[field];
+      delete extra[field];
+      return value === undefined ? null : value;
+    });
+    INTERNED_FIELDS.forEach(field => {
+      const value = extra[field];
+      delete extra[field];
+      row.push(value === undefined ? null : this.dictionaries[field].encode(value));
+    });
+    row.push(Object.keys(extra).length ? extra : null);
+    return row;
+  }
+
+  decode(row) {
+    const report = { ...row[row.length - 1] };
+    PLAIN_FIELDS.forEach((field, i) => {
+      if (row[i] !== null) report[field] = row[i];
+    });
+    INTERNED_FIELDS.forEach((field, i) => {
+      const code = row[PLAIN_FIELDS.length + i];
+      if (code !== null) report[field] = this.dictionaries[field].decode(code);
+    });
+    return report;
+  }
+
+  // { field, values } for strings interned since the last call
+  takeNewStrings() {
+    return INTERNED_FIELDS.flatMap(field => {
+      const { values } = this.dictionaries[field];
+      const start = this.flushed[field];
+      this.flushed[field] = values.length;
+      return values.length > start ? [{ field, values: values.slice(start) }] : [];
+    });
+  }
+
+  // Append strings written by takeNewStrings() on the encoding side
+  addStrings(field, values) {
+    const dictionary = this.dictionaries[field];
+    if (!dictionary) {
+      throw new Error(`Unknown interned field: ${field}`);
+    }
+    values.forEach(value => dictionary.encode(value));
+  }
+}
+
+export default Dictionary;
@@ -1,23 +1,14 @@
 import fraudDB from './fraudDatabase';
+import { normalizeIdentifier, toIdentifier } from './fraudDatabaseApi';
 
 // UPI ID Safety Checker Services - Now uses fraud database
 export const checkUpiSafety = async (upiId) => {
   try {
     // Normalize the identifier
-    let identifier = upiId;
-    
-    // Handle different types of identifiers
-    if (upiId.startsWith('phone_')) {
-      identifier = upiId; // Already formatted for phone
-    } else if (upiId.startsWith('link_')) {
-      identifier = upiId; // Already formatted for link
-    } else {
-      // Clean UPI ID
-      identifier = upiId.replace(/[.#$[\]]/g, '_');
-    }
+    const identifier = normalizeIdentifier(upiId);
     
     // Get data from fraud database
-    return fraudDB.getFraudData(identifier);
+    return await fraudDB.getFraudData(identifier);
   } catch (error) {
     console.error('Error checking safety:', error);
     // Return safe default on error
@@ -33,21 +24,41 @@ export const checkUpiSafety = async (upiId) => {
   }
 };
 
+// Batch Safety Checks - resolve many UPI IDs, phone numbers and payment links at
+// once (e.g. every payee in a pasted SMS thread), keyed the way the phone and
+// link checkers key them. Results come back in input order.
+export const checkSafetyBatch = async (identifiers) => {
+  const normalized = identifiers.map(toIdentifier);
+
+  try {
+    // Duplicates are resolved once and fanned back out
+    const unique = [...new Set(normalized)];
+    const results = await fraudDB.getFraudDataBatch(unique);
+    const resultsByIdentifier = new Map(unique.map((identifier, i) => [identifier, results[i]]));
+    return normalized.map(identifier => resultsByIdentifier.get(identifier));
+  } catch (error) {
+    console.error('Error checking safety batch:', error);
+    // Return safe defaults on error
+    return normalized.map(() => ({
+      safetyScore: 85,
+      reportCount: 0,
+      avgSeverity: 0,
+      lastReported: null,
+      riskLevel: 'safe',
+      totalAmount: 0,
+      reports: []
+    }));
+  }
+};
+
 // Report Fraud Services - Now uses fraud database
 export const reportFraud = async (upiId, reportData) => {
   try {
     // Normalize the identifier based on type
-    let identifier = upiId;
-    
-    if (upiId.startsWith('phone_') || upiId.startsWith('link_')) {
-      identifier = upiId; // Already formatted
-    } else {
-      // Clean UPI ID
-      identifier = upiId.replace(/[.#$[\]]/g, '_');
-    }
+    const identifier = normalizeIdentifier(upiId);
     
     // Add report to fraud database
-    const report = fraudDB.addFraudReport(identifier, {
+    const report = await fraudDB.addFraudReport(identifier, {
       ...reportData,
       reportedBy: reportData.reporterContact || 'Anonymous'
     });
@@ -68,13 +79,12 @@ export const reportFraud = async (upiId, reportData) => {
 
 // Recent Reports Feed Services - Now uses fraud database
 export const getRecentReports = (callback, limit = 20) => {
-  try {
-    const reports = fraudDB.getRecentReports(limit);
-    setTimeout(() => callback(reports), 100);
-  } catch (error) {
-    console.error('Error getting recent reports:', error);
-    callback([]);
-  }
+  fraudDB.getRecentReports(limit)
+    .then(reports => callback(reports))
+    .catch(error => {
+      console.error('Error getting recent reports:', error);
+      callback([]);
+    });
   
   // Return a cleanup function
   return () => {};
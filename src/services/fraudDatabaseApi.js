@@ -0,0 +1,69 @@
+// Fraud Database API - what the engine, its worker client and other services
+// share, kept free of the engine itself so importing it stays cheap
+
+// Async methods a FraudDatabase exposes to other threads (see fraudDatabaseClient.js)
+export const ENGINE_METHODS = [
+  'getFraudData',
+  'getFraudDataBatch',
+  'addFraudReport',
+  'getRecentReports',
+  'getReportsPage',
+  'updateReportsFeed',
+  'getStatistics',
+  'getTrends',
+  'getLeaderboard',
+  'searchReports',
+  'importReports',
+  'exportSnapshot',
+  'restoreSnapshot',
+  'exportMembershipFilter',
+  'benchmarkScoringModels',
+  'clearDatabase'
+];
+
+// Convert a UPI ID, phone_ or link_ key into the form used as a database key
+export const normalizeIdentifier = (identifier) => {
+  if (identifier.startsWith('phone_') || identifier.startsWith('link_')) {
+    return identifier; // Already formatted
+  }
+  // Clean UPI ID
+  return identifier.replace(/[.#$[\]]/g, '_');
+};
+
+// Indian mobile number, optionally prefixed with +91, 91 or 0
+const PHONE_PATTERN = /^(\+91|91|0)?[6-9]\d{9}$/;
+
+export const isPhoneNumber = (phone) => PHONE_PATTERN.test(phone.replace(/\s+/g, ''));
+
+// Phone number without spaces or its +91 / 91 / 0 prefix
+export const normalizePhoneNumber = (phone) => {
+  const cleaned = phone.replace(/\s+/g, '');
+  if (cleaned.startsWith('+91')) return cleaned.slice(3);
+  if (cleaned.startsWith('91')) return cleaned.slice(2);
+  if (cleaned.startsWith('0')) return cleaned.slice(1);
+  return cleaned;
+};
+
+export const normalizePaymentLink = (link) => link.toLowerCase().trim();
+
+// Database keys for a phone number and a payment link, as the checkers store them
+export const phoneIdentifier = (phone) => `phone_${normalizePhoneNumber(phone)}`;
+
+export const linkIdentifier = (link) =>
+  `link_${btoa(normalizePaymentLink(link)).replace(/[^a-zA-Z0-9]/g, '_')}`;
+
+// Database key for raw input: a UPI ID, phone number, payment link (any
+// scheme://, including upi://) or an existing phone_ / link_ key
+export const toIdentifier = (input) => {
+  const value = input.trim();
+  if (value.startsWith('phone_') || value.startsWith('link_')) {
+    return value;
+  }
+  if (isPhoneNumber(value)) {
+    return phoneIdentifier(value);
+  }
+  if (/^[a-z][a-z0-9+.-]*:\/\//i.test(value)) {
+    return linkIdentifier(value);
+  }
+  return normalizeIdentifier(value);
+};
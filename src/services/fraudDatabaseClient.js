@@ -0,0 +1,128 @@
+// Fraud Database Client - async proxy to a FraudDatabase engine running in a Web Worker,
+// or on the main thread when there is no worker or it fails
+import { ENGINE_METHODS } from './fraudDatabaseApi.js';
+
+export class FraudDatabaseClient {
+  constructor(worker) {
+    this.dbKey = 'upi-fraud-database';
+    this.reportsKey = 'upi-fraud-reports';
+    this.worker = worker;
+    this.nextId = 1;
+    this.pending = new Map();
+
+    // Main-thread engine, loaded on demand only if the worker can't be used
+    this.engine = null;
+
+    // Same method names as FraudDatabase, each returning a promise
+    ENGINE_METHODS.forEach(method => {
+      this[method] = (...args) => this.call(method, args);
+    });
+
+    // Progress callbacks can't cross the worker boundary; relay them as messages.
+    // Files are copied, but streams have to be transferred.
+    this.importReports = (source, { onProgress, ...options } = {}) =>
+      this.call('importReports', [source, options], onProgress, null,
+        typeof ReadableStream !== 'undefined' && source instanceof ReadableStream ? [source] : []);
+
+    // Neither can AbortSignals; aborting cancels the call in the worker instead
+    this.searchReports = (query, category, riskLevel, limit, { signal, ...options } = {}) =>
+      this.call('searchReports', [query, category, riskLevel, limit, options], null, signal);
+
+    if (!this.worker) {
+      this.ready = this.call('whenReady', []);
+      return;
+    }
+
+    this.worker.onmessage = (event) => this.handleMessage(event.data);
+    this.worker.onerror = (event) => {
+      console.error('Fraud database worker error:', event.message);
+      this.fallBackToMainThread(event.message);
+    };
+
+    // Hand over the legacy blob (if any) before the first call, then drop it
+    // once the worker has finished migrating. If the worker fails first, the
+    // main-thread engine migrates the blob itself.
+    this.worker.postMessage({ type: 'init', legacyJson: localStorage.getItem(this.dbKey) });
+    this.ready = this.call('whenReady', [])
+      .catch(error => {
+        if (this.worker) throw error;
+        return this.call('whenReady', []);
+      })
+      .then(() => {
+        localStorage.removeItem(this.dbKey);
+        localStorage.removeItem(this.reportsKey);
+      });
+  }
+
+  // Stop using a failed worker: reject the calls it was running and send
+  // later calls to an engine on the main thread
+  fallBackToMainThread(reason) {
+    if (!this.worker) return;
+    this.worker.terminate();
+    this.worker = null;
+
+    const error = new Error(`Fraud database worker failed: ${reason || 'unknown error'}`);
+    this.pending.forEach(call => call.reject(error));
+    this.pending.clear();
+  }
+
+  // Run a call on the main-thread engine, importing it on first use
+  async callEngine(method, args, onProgress, signal) {
+    if (!this.engine) {
+      this.engine = import('./fraudEngine.js').then(({ FraudDatabase }) => new FraudDatabase());
+    }
+    const engine = await this.engine;
+    if (method === 'whenReady') {
+      return engine.ready;
+    }
+
+    // Callbacks and signals go back into the options object, as in the worker
+    if (onProgress) args[args.length - 1].onProgress = onProgress;
+    if (signal) args[args.length - 1].signal = signal;
+    return engine[method](...args);
+  }
+
+  call(method, args, onProgress = null, signal = null, transfer = []) {
+    if (!this.worker) {
+      return this.callEngine(method, args, onProgress, signal);
+    }
+
+    return new Promise((resolve, reject) => {
+      if (signal && signal.aborted) {
+        reject(signal.reason || new DOMException('The operation was aborted', 'AbortError'));
+        return;
+      }
+
+      const id = this.nextId++;
+      this.pending.set(id, { resolve, reject, onProgress });
+      this.worker.postMessage({ type: 'call', id, method, args, withProgress: !!onProgress, withSignal: !!signal }, transfer);
+
+      if (signal) {
+        signal.addEventListener('abort', () => {
+          if (!this.pending.delete(id)) return;
+          this.worker.postMessage({ type: 'cancel', id });
+          reject(signal.reason || new DOMException('The operation was aborted', 'AbortError'));
+        }, { once: true });
+      }
+    });
+  }
+
+  handleMessage({ id, result, error, progress }) {
+    const call = this.pending.get(id);
+    if (!call) return;
+
+    if (progress) {
+      call.onProgress(progress);
+      return;
+    }
+    this.pending.delete(id);
+
+    if (error) {
+      call.reject(new Error(error));
+    } else {
+      call.resolve(result);
+    }
+  }
+}
+
+export default FraudDatabaseClient;
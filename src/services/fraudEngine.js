@@ -0,0 +1,1362 @@
+// Fraud Database Engine - IndexedDB-backed storage, scoring, search and stats
+import FraudStorage, { IDENTIFIERS_STORE, REPORTS_STORE } from './fraudStorage.js';
+import SearchIndex, { tokenize } from './searchIndex.js';
+import { parseReports, readLines } from './bulkImport.js';
+import BloomFilter from './bloomFilter.js';
+import ReportColumns from './reportColumns.js';
+import { ReportCodec } from './dictionary.js';
+import { GRANULARITIES, STORED_GRANULARITIES, bucketStart, buildTrend, collectRollups, mergeRollup } from './rollups.js';
+import RescoreScheduler from './rescoreScheduler.js';
+import { DEFAULT_MODEL, SCORING_MODELS, ScoreColumns, benchmarkModels, riskLevelFor, scoreAll, scoreRecord } from './scoring.js';
+import { ENGINE_METHODS, normalizeIdentifier } from './fraudDatabaseApi.js';
+
+// Max identifiers kept decoded in memory; oldest entries are evicted first
+const CACHE_LIMIT = 5000;
+
+// Reports fetched per storage round trip when resolving search hits
+const SEARCH_BATCH = 200;
+
+// Reports written per transaction during bulk imports
+const IMPORT_BATCH = 1000;
+
+// Snapshot format version, written in the first line of every export.
+// 2: reports are dictionary-encoded rows (see ReportCodec)
+// 3: ends with an { type: 'end', records, reports } line counting what was written
+const SNAPSHOT_VERSION = 3;
+
+// Bump to re-run the full repair (rebuildReportsFeed) once on existing data.
+// 2: identifier records carry score state (severitySum, lastReported, scoreDay)
+// 3: score state includes per-category report counts
+// 4: hourly and daily rollups
+// 5: identifier records carry dangerRank for the risk leaderboard
+const DATA_VERSION = 5;
+
+const DAY_MS = 1000 * 60 * 60 * 24;
+
+// Day number a timestamp falls in; stored scores are reused within a day
+const dayBucket = (time) => Math.floor(time / DAY_MS);
+
+// Leaderboard orderings: the identifier index to walk and which end is "top"
+const LEADERBOARDS = {
+  reports: { index: 'totalReports', direction: 'prev' },
+  amount: { index: 'totalAmount', direction: 'prev' },
+  risk: { index: 'dangerRank', direction: 'prev' }
+};
+
+export { ENGINE_METHODS, normalizeIdentifier };
+
+const createReportId = () => `rpt_${Date.now()}_${Math.random().toString(36).substr(2, 5)}`;
+
+// localStorage only exists on the main thread, not inside workers
+const hasLocalStorage = () => typeof localStorage !== 'undefined';
+
+// Stop work for a cancelled caller
+const throwIfAborted = (signal) => {
+  if (signal && signal.aborted) {
+    throw signal.reason || new DOMException('The operation was aborted', 'AbortError');
+  }
+};
+
+// Demo data seeded into an empty database (legacy whole-blob shape)
+const createDemoData = () => {
+  return {
+    // UPI ID reports
+    'fraud@paytm': {
+      reports: [
+        {
+          id: 'rpt_001',
+          reportedBy: 'user1@example.com',
+          description: 'Impersonated bank customer service, asked for OTP and PIN',
+          amount: 15000,
+          severity: 5,
+          category: 'phishing',
+          timestamp: Date.now() - 86400000, // 1 day ago
+          verified: true
+        },
+        {
+          id: 'rpt_002',
+          reportedBy: 'user2@example.com', 
+          description: 'Fake payment request claiming to be from delivery service',
+          amount: 2500,
+          severity: 4,
+          category: 'payment_fraud',
+          timestamp: Date.now() - 172800000, // 2 days ago
+          verified: true
+        }
+      ],
+      safetyScore: 15,
+      totalReports: 2,
+      totalAmount: 17500,
+      riskLevel: 'danger'
+    },
+    'scammer@phonepe': {
+      reports: [
+        {
+          id: 'rpt_003',
+          reportedBy: 'user3@example.com',
+          description: 'QR code scam at fake grocery store, duplicate transaction',
+          amount: 3200,
+          severity: 3,
+          category: 'fake_merchant',
+          timestamp: Date.now() - 259200000, // 3 days ago
+          verified: true
+        }
+      ],
+      safetyScore: 25,
+      totalReports: 1,
+      totalAmount: 3200,
+      riskLevel: 'danger'
+    },
+    'phone_9876543210': {
+      reports: [
+        {
+          id: 'rpt_004',
+          reportedBy: 'user4@example.com',
+          description: 'Fake bank call asking for card details and UPI PIN',
+          amount: 8500,
+          severity: 5,
+          category: 'phone_fraud',
+          timestamp: Date.now() - 345600000, // 4 days ago
+          verified: true
+        },
+        {
+          id: 'rpt_005',
+          reportedBy: 'user5@example.com',
+          description: 'Pretended to be from insurance company, demanded instant payment',
+          amount: 12000,
+          severity: 4,
+          category: 'phone_fraud',
+          timestamp: Date.now() - 432000000, // 5 days ago
+          verified: true
+        }
+      ],
+      safetyScore: 20,
+      totalReports: 2,
+      totalAmount: 20500,
+      riskLevel: 'danger'
+    },
+    'phone_8765432109': {
+      reports: [
+        {
+          id: 'rpt_006',
+          reportedBy: 'user6@example.com',
+          description: 'Suspicious calls claiming lottery win, asked for processing fee',
+          amount: 5000,
+          severity: 3,
+          category: 'phone_fraud',
+          timestamp: Date.now() - 518400000, // 6 days ago
+          verified: true
+        }
+      ],
+      safetyScore: 40,
+      totalReports: 1,
+      totalAmount: 5000,
+      riskLevel: 'moderate'
+    },
+    'link_aHR0cHM6Ly9mYWtlcGF5dG0uY29t': {
+      reports: [
+        {
+          id: 'rpt_007',
+          reportedBy: 'user7@example.com',
+          description: 'Fake Paytm website link sent via SMS, collected card details',
+          amount: 7500,
+          severity: 4,
+          category: 'link_fraud',
+          timestamp: Date.now() - 604800000, // 7 days ago
+          verified: true,
+          originalLink: 'https://fakepaytm.com'
+        }
+      ],
+      safetyScore: 30,
+      totalReports: 1,
+      totalAmount: 7500,
+      riskLevel: 'moderate'
+    }
+  };
+};
+
+export class FraudDatabase {
+  // legacyJson lets a worker-hosted engine receive the legacy blob from the page;
+  // backgroundRescore keeps stored scores current while idle; scoringModel is
+  // one of the models in scoring.js
+  constructor(storage = new FraudStorage(), { legacyJson, backgroundRescore = true, scoringModel = DEFAULT_MODEL } = {}) {
+    // Legacy localStorage keys, migrated into IndexedDB on first run
+    this.dbKey = 'upi-fraud-database';
+    this.reportsKey = 'upi-fraud-reports';
+    this.syncKey = 'upi-fraud-database-sync';
+    this.legacyJson = legacyJson;
+    this.storage = storage;
+    this.scoringModel = scoringModel;
+
+    // Decoded identifier entries ({ record, reports }, or null when never reported)
+    this.cache = new Map();
+
+    // Running totals persisted in the meta store, loaded on demand
+    this.statistics = null;
+
+    // Bloom filter over reported identifiers; a miss skips the lookup entirely
+    this.membershipFilter = null;
+    this.membershipFilterLoad = null;
+    // Set when the database is replaced mid-load, so the load reads again
+    this.membershipFilterStale = false;
+    // Identifiers other tabs reported while the filter was unset or loading
+    this.pendingFilterIdentifiers = [];
+
+    // Inverted index over report text, built on first search
+    this.searchIndexPromise = null;
+    this.pendingIndexIds = [];
+
+    // Typed-array columns over every report for filters and aggregates, built on first use
+    this.reportColumnsPromise = null;
+    this.pendingColumnIds = [];
+
+    this.listenForChanges();
+
+    this.ready = this.initializeDatabase();
+
+    // Recency decay moves scores daily; rescore stale ones in idle time
+    this.rescoreScheduler = new RescoreScheduler(this);
+    if (backgroundRescore) {
+      this.ready.then(() => this.rescoreScheduler.start(), () => {});
+    }
+  }
+
+  // Stop background rescoring and cross-tab listening
+  close() {
+    this.rescoreScheduler.stop();
+    if (this.channel) {
+      this.channel.close();
+    }
+  }
+
+  // Drop cached entries when another tab writes to the database
+  listenForChanges() {
+    const handleChange = (change) => {
+      if (change.type === 'reports') {
+        change.identifiers.forEach(identifier => {
+          this.cache.delete(identifier);
+          if (this.membershipFilter) this.membershipFilter.add(identifier);
+          // A load in progress may have read the filter before this write
+          if (!this.membershipFilter || this.membershipFilterLoad) {
+            this.pendingFilterIdentifiers.push(identifier);
+          }
+        });
+        this.statistics = null;
+        this.pendingIndexIds.push(...change.reportIds);
+        this.pendingColumnIds.push(...change.reportIds);
+      } else {
+        this.cache.clear();
+        this.statistics = null;
+        this.resetReportIndexes();
+        // Disable the fast path until the other tab's filter is reloaded,
+        // by a load that reads it after this change
+        this.membershipFilter = null;
+        this.membershipFilterStale = true;
+        this.loadMembershipFilter();
+      }
+    };
+
+    if (typeof BroadcastChannel !== 'undefined') {
+      this.channel = new BroadcastChannel(this.dbKey);
+      this.channel.onmessage = (event) => handleChange(event.data);
+    } else if (typeof window !== 'undefined') {
+      window.addEventListener('storage', (event) => {
+        if (event.key === this.syncKey && event.newValue) {
+          handleChange(JSON.parse(event.newValue));
+        }
+      });
+    }
+  }
+
+  // Tell other tabs which cached entries are stale
+  broadcastChange(change) {
+    if (this.channel) {
+      this.channel.postMessage(change);
+    } else if (hasLocalStorage()) {
+      localStorage.setItem(this.syncKey, JSON.stringify({ ...change, at: Date.now() }));
+    }
+  }
+
+  cacheEntry(identifier, entry) {
+    this.cache.delete(identifier);
+    this.cache.set(identifier, entry);
+    if (this.cache.size > CACHE_LIMIT) {
+      this.cache.delete(this.cache.keys().next().value);
+    }
+  }
+
+  // Get the decoded entry for one identifier, reading storage only on a cache miss
+  async loadIdentifier(identifier) {
+    if (this.cache.has(identifier)) {
+      return this.cache.get(identifier);
+    }
+
+    const { record, reports } = await this.storage.getIdentifierWithReports(identifier);
+    const entry = record ? { record, reports } : null;
+    this.cacheEntry(identifier, entry);
+    return entry;
+  }
+
+  // Initialize database, migrating legacy data or seeding demo data once
+  async initializeDatabase() {
+    if (!(await this.storage.getMeta('initialized'))) {
+      await this.migrateLegacyData();
+    }
+    if ((await this.storage.getMeta('dataVersion') || 1) < DATA_VERSION) {
+      await this.rebuildReportsFeed();
+      await this.storage.setMeta('dataVersion', DATA_VERSION);
+    }
+    await this.loadMembershipFilter();
+  }
+
+  async migrateLegacyData() {
+    const legacyDatabase = this.readLegacyDatabase();
+    await this.importLegacyDatabase(legacyDatabase || createDemoData());
+    await this.rebuildReportsFeed();
+    await this.storage.setMeta('initialized', true);
+    await this.storage.setMeta('dataVersion', DATA_VERSION);
+    this.legacyJson = null;
+
+    // The old blobs are no longer read; free the localStorage quota
+    this.removeLegacyData();
+  }
+
+  removeLegacyData() {
+    if (hasLocalStorage()) {
+      localStorage.removeItem(this.dbKey);
+      localStorage.removeItem(this.reportsKey);
+    }
+  }
+
+  // Load the persisted membership filter, building it on first use.
+  // Concurrent callers share one load.
+  loadMembershipFilter() {
+    if (!this.membershipFilterLoad) {
+      this.membershipFilterLoad = (async () => {
+        let filter = null;
+        while (!filter || this.membershipFilterStale) {
+          this.membershipFilterStale = false;
+          const stored = await this.storage.getMeta('membershipFilter');
+          filter = stored ? BloomFilter.fromJSON(stored) : await this.buildMembershipFilter();
+        }
+        this.pendingFilterIdentifiers.forEach(identifier => filter.add(identifier));
+        this.pendingFilterIdentifiers = [];
+        this.membershipFilter = filter;
+      })().finally(() => {
+        this.membershipFilterLoad = null;
+      });
+    }
+    return this.membershipFilterLoad;
+  }
+
+  async rebuildMembershipFilter() {
+    this.membershipFilter = await this.buildMembershipFilter();
+  }
+
+  // Build a filter over every stored identifier and persist it
+  async buildMembershipFilter() {
+    const filter = BloomFilter.from(await this.storage.getAllIdentifierKeys());
+    await this.storage.setMeta('membershipFilter', filter.toStored());
+    return filter;
+  }
+
+  // The stored filter (read in the writing transaction) with `identifiers`
+  // added, so saving never drops identifiers other tabs stored since this tab
+  // loaded its copy. Also joins those into this tab's filter when the sizes
+  // match. Null when nothing was stored, so the next load rebuilds it.
+  mergeMembershipFilter(stored, identifiers) {
+    if (!stored) {
+      return this.membershipFilter ? this.membershipFilter.toStored() : null;
+    }
+    const filter = BloomFilter.fromJSON(stored);
+    if (this.membershipFilter && filter.union(this.membershipFilter)) {
+      this.membershipFilter = filter;
+    } else {
+      identifiers.forEach(identifier => filter.add(identifier));
+    }
+    return filter.toStored();
+  }
+
+  // Filter as JSON (base64 bit array), small enough to ship as a static asset
+  async exportMembershipFilter() {
+    await this.ready;
+    return this.membershipFilter.toJSON();
+  }
+
+  // False only when the identifier has definitely never been reported
+  mightBeReported(identifier) {
+    return !this.membershipFilter || this.membershipFilter.mightContain(identifier);
+  }
+
+  // Read the legacy whole-blob database, if one exists
+  readLegacyDatabase() {
+    try {
+      const json = this.legacyJson !== undefined
+        ? this.legacyJson
+        : hasLocalStorage() && localStorage.getItem(this.dbKey);
+      return JSON.parse(json || 'null');
+    } catch (error) {
+      console.error('Error reading legacy fraud database:', error);
+      return null;
+    }
+  }
+
+  // Split a legacy { identifier: { reports, ...summary } } blob into records and reports.
+  // The legacy feed is derived data, so it is rebuilt rather than copied.
+  async importLegacyDatabase(database) {
+    const records = [];
+    const reports = [];
+
+    Object.entries(database).forEach(([identifier, data]) => {
+      const { reports: identifierReports = [], ...summary } = data;
+      records.push({
+        ...summary,
+        identifier,
+        totalReports: identifierReports.length
+      });
+      identifierReports.forEach(report => {
+        reports.push({ ...report, identifier });
+      });
+    });
+
+    await this.storage.putMany(records, reports);
+  }
+
+  // Get fraud data for a specific identifier
+  async getFraudData(identifier) {
+    await this.ready;
+    if (!this.mightBeReported(identifier)) {
+      return this.describeEntry(null);
+    }
+    const entries = new Map([[identifier, await this.loadIdentifier(identifier)]]);
+    await this.refreshScores(entries);
+    return this.describeEntry(entries.get(identifier));
+  }
+
+  // Get fraud data for many identifiers, in input order, reading every cache
+  // miss from storage in a single transaction
+  async getFraudDataBatch(identifiers) {
+    await this.ready;
+    const entries = new Map();
+    const uncached = [];
+    new Set(identifiers).forEach(identifier => {
+      if (!this.mightBeReported(identifier)) {
+        entries.set(identifier, null);
+      } else if (this.cache.has(identifier)) {
+        entries.set(identifier, this.cache.get(identifier));
+      } else {
+        uncached.push(identifier);
+      }
+    });
+
+    if (uncached.length) {
+      const loaded = await this.storage.getIdentifiersWithReports(uncached);
+      loaded.forEach((entry, identifier) => {
+        entries.set(identifier, entry);
+        this.cacheEntry(identifier, entry);
+      });
+    }
+
+    await this.refreshScores(entries);
+    return identifiers.map(identifier => this.describeEntry(entries.get(identifier)));
+  }
+
+  // Give a record its score as of `now`, remembering the day it was computed
+  withScore(record, now = Date.now()) {
+    return this.applyScore(record, scoreRecord(record, this.scoringModel, now), now);
+  }
+
+  // Record with a computed score, the day it was computed, and its rank on the
+  // risk leaderboard (least safe first, ties going to the most reported)
+  applyScore(record, { safetyScore, riskLevel }, now) {
+    return {
+      ...record,
+      safetyScore,
+      riskLevel,
+      scoreDay: dayBucket(now),
+      dangerRank: [100 - safetyScore, record.totalReports]
+    };
+  }
+
+  // Rescore entries whose score was computed on an earlier day (recency decay
+  // moves it), replacing them in the map
+  async refreshScores(entries) {
+    const now = Date.now();
+    const today = dayBucket(now);
+    const stale = [...entries]
+      .filter(([, entry]) => entry && entry.record.scoreDay !== today)
+      .map(([identifier]) => identifier);
+    if (!stale.length) return;
+
+    const rescored = new Map();
+    (await this.rescoreRecords(stale)).forEach(({ record }) => rescored.set(record.identifier, record));
+
+    stale.forEach(identifier => {
+      const entry = entries.get(identifier);
+      // Not rescored means another writer already did it today
+      const record = rescored.get(identifier) || this.withScore(entry.record, now);
+      entries.set(identifier, { record, reports: entry.reports });
+    });
+  }
+
+  // Rescore up to `limit` identifiers whose stored score predates today, oldest
+  // first. Returns how many were rescored (fewer than limit once none are left).
+  async rescoreStale(limit) {
+    await this.ready;
+    const changes = await this.rescoreRecords({ staleBefore: dayBucket(Date.now()), limit });
+    return changes.length;
+  }
+
+  // Rescore stored records (a list of identifiers or a { staleBefore, limit }
+  // selection) scored on an earlier day, persisting the new scores and risk
+  // counts together and writing through to cached entries
+  async rescoreRecords(selection) {
+    const now = Date.now();
+    const today = dayBucket(now);
+    const { changes, statistics } = await this.storage.rescoreRecords(
+      selection,
+      (record) => (record.scoreDay === today ? null : this.withScore(record, now)),
+      (current, rescored) => this.applyReportsToStatistics(current, [], rescored)
+    );
+    if (!changes.length) return changes;
+
+    this.statistics = statistics || null;
+    changes.forEach(({ record }) => {
+      const cached = this.cache.get(record.identifier);
+      if (cached) {
+        // Replace in place; a background rescore shouldn't count as a use
+        this.cache.set(record.identifier, { record, reports: cached.reports });
+      }
+    });
+    this.broadcastChange({
+      type: 'reports',
+      identifiers: changes.map(({ record }) => record.identifier),
+      reportIds: []
+    });
+
+    return changes;
+  }
+
+  // Build the safety result for a decoded { record, reports } entry (or null)
+  // from the record's cached score state, without scanning its reports
+  describeEntry(entry) {
+    if (!entry || !entry.record.totalReports) {
+      return {
+        safetyScore: 85,
+        reportCount: 0,
+        avgSeverity: 0,
+        lastReported: null,
+        riskLevel: 'safe',
+        totalAmount: 0,
+        reports: []
+      };
+    }
+
+    const { record, reports } = entry;
+
+    return {
+      safetyScore: record.safetyScore,
+      reportCount: record.totalReports,
+      avgSeverity: record.severitySum / record.totalReports,
+      lastReported: record.lastReported,
+      riskLevel: record.riskLevel,
+      totalAmount: record.totalAmount || 0,
+      reports: [...reports]
+    };
+  }
+
+  // Add a new fraud report
+  async addFraudReport(identifier, reportData) {
+    await this.ready;
+
+    const newReport = {
+      id: createReportId(),
+      ...reportData,
+      timestamp: Date.now(),
+      verified: false // New reports need verification
+    };
+
+    const [storedReport] = await this.storeReports([{ identifier, report: newReport }]);
+    return storedReport;
+  }
+
+  // Import reports from an NDJSON or CSV File/Blob/ReadableStream in batched
+  // transactions. Rows may carry their own id, timestamp and verified flag.
+  // onProgress receives { imported, skipped, bytesRead, totalBytes } after each batch.
+  async importReports(source, { format, onProgress = () => {} } = {}) {
+    await this.ready;
+
+    const progress = { imported: 0, skipped: 0, bytesRead: 0, totalBytes: source.size || null };
+    const rows = parseReports(source, {
+      format,
+      onBytes: (bytesRead) => { progress.bytesRead = bytesRead; },
+      onSkip: () => { progress.skipped++; }
+    });
+
+    let batch = [];
+    const flush = async () => {
+      // Rows whose id is already stored are skipped rather than counted twice
+      const stored = await this.storeReports(batch);
+      progress.imported += stored.length;
+      progress.skipped += batch.length - stored.length;
+      batch = [];
+      onProgress({ ...progress });
+    };
+
+    for await (const { identifier, reportData } of rows) {
+      batch.push({
+        identifier: normalizeIdentifier(identifier),
+        report: {
+          id: createReportId(),
+          timestamp: Date.now(),
+          verified: false,
+          ...reportData
+        }
+      });
+      if (batch.length >= IMPORT_BATCH) {
+        await flush();
+      }
+    }
+    if (batch.length) {
+      await flush();
+    }
+
+    return progress;
+  }
+
+  // Yield the database as NDJSON lines: a header, the statistics, every
+  // identifier record, every report, then an end line with the counts, read
+  // from storage one page at a time. Reports are written as arrays of values
+  // and dictionary codes; each page is preceded by the strings it interns for
+  // the first time. The end line lets a restore detect a truncated file.
+  async *snapshotLines() {
+    yield JSON.stringify({
+      type: 'snapshot',
+      version: SNAPSHOT_VERSION,
+      dataVersion: DATA_VERSION,
+      exportedAt: Date.now(),
+      reportFields: ReportCodec.fields
+    }) + '\n';
+    yield JSON.stringify({ type: 'statistics', statistics: await this.storage.getMeta('statistics') }) + '\n';
+
+    const codec = new ReportCodec();
+    const stores = [
+      [IDENTIFIERS_STORE, 'identifier', (record) => JSON.stringify({ type: 'record', record })],
+      [REPORTS_STORE, 'id', (report) => JSON.stringify(codec.encode(report))]
+    ];
+    const counts = { [IDENTIFIERS_STORE]: 0, [REPORTS_STORE]: 0 };
+    for (const [storeName, keyField, toLine] of stores) {
+      let after = null;
+      while (true) {
+        const page = await this.storage.getPage(storeName, after, IMPORT_BATCH);
+        if (page.length === 0) break;
+
+        const lines = page.map(toLine);
+        const strings = codec.takeNewStrings().map(({ field, values }) =>
+          JSON.stringify({ type: 'strings', field, values }));
+        yield [...strings, ...lines].join('\n') + '\n';
+        counts[storeName] += page.length;
+        after = page[page.length - 1][keyField];
+      }
+    }
+    yield JSON.stringify({ type: 'end', records: counts[IDENTIFIERS_STORE], reports: counts[REPORTS_STORE] }) + '\n';
+  }
+
+  // Export the whole database as an NDJSON Blob, gzip-compressed when compress
+  // is set. The Blob is assembled from streamed chunks, never one big string.
+  async exportSnapshot({ compress = false } = {}) {
+    await this.ready;
+
+    const lines = this.snapshotLines();
+    let stream = new ReadableStream({
+      async pull(controller) {
+        const { value, done } = await lines.next();
+        if (done) {
+          controller.close();
+        } else {
+          controller.enqueue(value);
+        }
+      }
+    }).pipeThrough(new TextEncoderStream());
+
+    if (compress) {
+      stream = stream.pipeThrough(new CompressionStream('gzip'));
+    }
+
+    const blob = await new Response(stream).blob();
+    return new Blob([blob], { type: compress ? 'application/gzip' : 'application/x-ndjson' });
+  }
+
+  // Parsed entries of a snapshot File/Blob (plain or gzip), header first.
+  // Throws if the file doesn't start with a supported snapshot header.
+  async *snapshotEntries(source) {
+    const magic = new Uint8Array(await source.slice(0, 2).arrayBuffer());
+    const gzipped = magic[0] === 0x1f && magic[1] === 0x8b;
+    const stream = gzipped
+      ? source.stream().pipeThrough(new DecompressionStream('gzip'))
+      : source.stream();
+
+    let header = null;
+    for await (const line of readLines(stream)) {
+      if (!line.trim()) continue;
+      const entry = JSON.parse(line);
+
+      if (!header) {
+        if (entry.type !== 'snapshot' || entry.version > SNAPSHOT_VERSION) {
+          throw new Error('Unsupported fraud database snapshot');
+        }
+        header = entry;
+      }
+      yield entry;
+    }
+    if (!header) {
+      throw new Error('Empty fraud database snapshot');
+    }
+  }
+
+  // Replace the database with the contents of a snapshot File/Blob (plain or gzip)
+  async restoreSnapshot(source) {
+    await this.ready;
+
+    // Read the whole file before discarding anything, so a truncated or
+    // corrupt snapshot leaves the current data in place. Snapshots before
+    // version 3 have no end line, so only their contents can be checked.
+    const check = new ReportCodec();
+    const counted = { records: 0, reports: 0 };
+    let header = null;
+    let end = null;
+    for await (const entry of this.snapshotEntries(source)) {
+      let report = null;
+      if (!header) {
+        header = entry;
+      } else if (end) {
+        throw new Error('Invalid fraud database snapshot: data after the end line');
+      } else if (Array.isArray(entry)) {
+        report = check.decode(entry);
+      } else if (entry.type === 'strings') {
+        check.addStrings(entry.field, entry.values);
+      } else if (entry.type === 'record') {
+        if (!(entry.record && entry.record.identifier)) {
+          throw new Error('Invalid fraud database snapshot record');
+        }
+        counted.records++;
+      } else if (entry.type === 'report') {
+        report = entry.report;
+      } else if (entry.type === 'end') {
+        end = entry;
+      }
+
+      if (report) {
+        if (report.id === undefined || report.id === null || !report.identifier) {
+          throw new Error('Invalid fraud database snapshot report');
+        }
+        counted.reports++;
+      }
+    }
+    if (header.version >= 3 && !(end && end.records === counted.records && end.reports === counted.reports)) {
+      throw new Error('Incomplete fraud database snapshot');
+    }
+
+    let statistics = null;
+    let records = [];
+    let reports = [];
+    let restored = 0;
+    const flush = async () => {
+      await this.storage.putMany(records, reports);
+      restored += reports.length;
+      records = [];
+      reports = [];
+    };
+
+    // Version 2+ snapshots intern report strings as codes
+    const codec = new ReportCodec();
+
+    let cleared = false;
+    try {
+      for await (const entry of this.snapshotEntries(source)) {
+        if (!cleared) {
+          cleared = true;
+          await this.storage.clear();
+          // Even a partly restored database must not be reseeded with demo data
+          await this.storage.setMeta('initialized', true);
+        } else if (Array.isArray(entry)) {
+          reports.push(codec.decode(entry));
+        } else if (entry.type === 'strings') {
+          codec.addStrings(entry.field, entry.values);
+        } else if (entry.type === 'statistics') {
+          statistics = entry.statistics;
+        } else if (entry.type === 'record') {
+          records.push(entry.record);
+        } else if (entry.type === 'report') {
+          reports.push(entry.report);
+        }
+
+        if (records.length + reports.length >= IMPORT_BATCH) {
+          await flush();
+        }
+      }
+      await flush();
+
+      if (statistics) {
+        await this.storage.setMeta('statistics', statistics);
+      }
+
+      // Snapshots from older builds lack newer derived fields; repair them.
+      // Rollups are derived data and never exported.
+      if ((header.dataVersion || 1) < DATA_VERSION) {
+        await this.rebuildReportsFeed();
+      } else {
+        await this.rebuildRollups();
+      }
+      await this.storage.setMeta('dataVersion', DATA_VERSION);
+    } finally {
+      // Once storage was cleared, nothing held in memory matches it, even if
+      // the restore failed part way
+      if (cleared) {
+        this.cache.clear();
+        this.statistics = null;
+        this.resetReportIndexes();
+        await this.rebuildMembershipFilter();
+        this.broadcastChange({ type: 'all' });
+      }
+    }
+
+    return { restored };
+  }
+
+  // Write new reports ({ identifier, report } entries) in one transaction,
+  // updating each affected identifier's score state and score once. Records are
+  // read inside the writing transaction, so concurrent writes can't lose counts.
+  // Reports whose id is already stored (or repeated in the batch) are skipped;
+  // resolves with the reports actually written.
+  async storeReports(entries) {
+    const reportsByIdentifier = new Map();
+    entries.forEach(({ identifier, report }) => {
+      if (!reportsByIdentifier.has(identifier)) {
+        reportsByIdentifier.set(identifier, []);
+      }
+      reportsByIdentifier.get(identifier).push({ ...report, identifier });
+    });
+
+    const identifiers = [...reportsByIdentifier.keys()];
+    const reportIds = [...new Set(entries.map(({ report }) => report.id))];
+    const now = Date.now();
+
+    // New identifiers must reach the filter, or lookups would skip them
+    if (!this.membershipFilter) {
+      await this.loadMembershipFilter();
+    }
+
+    const { records, reports: newReports, changes, statistics } = await this.storage.putReports(identifiers, reportIds, (stored, existingIds) => {
+      const seenIds = new Set(existingIds);
+      const records = [];
+      const newReports = [];
+      const changes = [];
+
+      reportsByIdentifier.forEach((reports, identifier) => {
+        const added = reports.filter(report => !seenIds.has(report.id) && seenIds.add(report.id));
+        if (!added.length) return;
+        const record = stored.get(identifier) || null;
+
+        // Resolve the feed fields once, from the identifier's first report
+        const identifierType = this.getIdentifierType(identifier);
+        const displayIdentifier = (record && record.displayIdentifier) ||
+          this.getDisplayIdentifier(identifier, added[0]);
+        added.forEach(report => {
+          report.identifierType = identifierType;
+          report.displayIdentifier = displayIdentifier;
+        });
+
+        const updatedRecord = this.withScore({
+          ...(record || { identifier }),
+          identifierType,
+          displayIdentifier,
+          ...this.addToScoreState(record || this.scoreState([]), added)
+        }, now);
+
+        records.push(updatedRecord);
+        newReports.push(...added);
+        changes.push({ previousRecord: record, record: updatedRecord, added });
+      });
+
+      // New identifiers join the membership filter, persisted with the reports
+      const metaUpdates = {};
+      const newIdentifiers = changes
+        .filter(change => !change.previousRecord)
+        .map(({ record }) => record.identifier);
+      if (newIdentifiers.length) {
+        if (this.membershipFilter) {
+          newIdentifiers.forEach(identifier => this.membershipFilter.add(identifier));
+        } else {
+          this.pendingFilterIdentifiers.push(...newIdentifiers);
+        }
+        metaUpdates.membershipFilter = (stored) => this.mergeMembershipFilter(stored, newIdentifiers);
+      }
+
+      return {
+        records,
+        reports: newReports,
+        changes,
+        metaUpdates,
+        rollupDeltas: [...collectRollups(newReports).values()],
+        updateStatistics: (current) => this.applyReportsToStatistics(current, newReports, changes)
+      };
+    }, { mergeRollup });
+
+    if (!records.length) return [];
+    this.statistics = statistics || null;
+    if (this.membershipFilter && this.membershipFilter.isFull) {
+      await this.rebuildMembershipFilter();
+    }
+
+    // Write through to cached entries when they were current (a cached null
+    // means never reported), otherwise drop them; then notify other tabs.
+    // Report rows double as feed entries, so nothing else needs rebuilding.
+    changes.forEach(({ previousRecord, record, added }) => {
+      const { identifier } = record;
+      if (!this.cache.has(identifier)) return;
+      const cached = this.cache.get(identifier);
+      const current = cached
+        ? previousRecord && cached.record.totalReports === previousRecord.totalReports
+        : !previousRecord;
+      if (current) {
+        this.cacheEntry(identifier, { record, reports: cached ? [...cached.reports, ...added] : added });
+      } else {
+        this.cache.delete(identifier);
+      }
+    });
+    this.broadcastChange({
+      type: 'reports',
+      identifiers: records.map(record => record.identifier),
+      reportIds: newReports.map(report => report.id)
+    });
+
+    if (this.searchIndexPromise) {
+      this.searchIndexPromise.then(index => newReports.forEach(report => index.add(report)));
+    }
+    if (this.reportColumnsPromise) {
+      this.reportColumnsPromise.then(columns => newReports.forEach(report => columns.add(report)));
+    }
+
+    return newReports;
+  }
+
+  // Score state (the inputs to scoreRecord) for a list of reports
+  scoreState(reports) {
+    return this.addToScoreState({ totalReports: 0, totalAmount: 0, severitySum: 0, lastReported: 0, categoryCounts: {} }, reports);
+  }
+
+  // Score state after adding reports to an existing state
+  addToScoreState(state, reports) {
+    let { totalReports, severitySum, lastReported } = state;
+    let totalAmount = state.totalAmount || 0;
+    const categoryCounts = { ...state.categoryCounts };
+    reports.forEach(report => {
+      const category = report.category || 'other';
+      totalReports++;
+      totalAmount += report.amount || 0;
+      severitySum += report.severity || 0;
+      lastReported = Math.max(lastReported, report.timestamp);
+      categoryCounts[category] = (categoryCounts[category] || 0) + 1;
+    });
+    return { totalReports, totalAmount, severitySum, lastReported, categoryCounts };
+  }
+
+  // Get all recent reports for the feed
+  async getRecentReports(limit = 50) {
+    await this.ready;
+    return this.storage.getReportsByRecency(limit);
+  }
+
+  // Get one page of the feed, newest first. Pass the previous page's
+  // nextCursor to continue with older reports; it is null on the last page.
+  async getReportsPage(limit = 50, cursor = null) {
+    await this.ready;
+    const reports = await this.storage.getReportsByRecency(limit, cursor);
+    const last = reports[reports.length - 1];
+
+    return {
+      reports,
+      nextCursor: reports.length === limit && last ? [last.timestamp, last.id] : null
+    };
+  }
+
+  // Repair the reports feed by recomputing it from scratch (not used on writes)
+  async updateReportsFeed() {
+    await this.ready;
+    return this.rebuildReportsFeed();
+  }
+
+  // Call visit(page) on successive pages of a store, in key order
+  async forEachPage(storeName, keyField, visit) {
+    let after = null;
+    while (true) {
+      const page = await this.storage.getPage(storeName, after, IMPORT_BATCH);
+      if (page.length === 0) return;
+      await visit(page);
+      after = page[page.length - 1][keyField];
+    }
+  }
+
+  // Recompute the denormalized feed fields (type, display identifier) and the
+  // score state on every report and identifier record, resolving each
+  // identifier only once. Stores are read a page at a time, never whole.
+  async rebuildReportsFeed() {
+    // Score state and earliest report per identifier
+    const states = new Map();
+    const firstReports = new Map();
+    await this.forEachPage(REPORTS_STORE, 'id', (page) => {
+      const reportsByIdentifier = new Map();
+      page.forEach(report => {
+        if (!reportsByIdentifier.has(report.identifier)) {
+          reportsByIdentifier.set(report.identifier, []);
+        }
+        reportsByIdentifier.get(report.identifier).push(report);
+
+        const first = firstReports.get(report.identifier);
+        if (!first || report.timestamp < first.timestamp) {
+          firstReports.set(report.identifier, report);
+        }
+      });
+      reportsByIdentifier.forEach((reports, identifier) => {
+        states.set(identifier, this.addToScoreState(states.get(identifier) || this.scoreState([]), reports));
+      });
+    });
+
+    const feedFields = new Map();
+    const fieldsFor = (identifier) => {
+      if (!feedFields.has(identifier)) {
+        feedFields.set(identifier, {
+          identifierType: this.getIdentifierType(identifier),
+          displayIdentifier: this.getDisplayIdentifier(identifier, firstReports.get(identifier))
+        });
+      }
+      return feedFields.get(identifier);
+    };
+
+    // Repair the reports, collecting report totals and rollups on the way
+    const reportColumns = new ReportColumns();
+    const rollups = new Map();
+    await this.forEachPage(REPORTS_STORE, 'id', async (page) => {
+      const repairedReports = page.map(report => ({ ...report, ...fieldsFor(report.identifier) }));
+      repairedReports.forEach(report => reportColumns.add(report));
+      collectRollups(repairedReports, rollups);
+      await this.storage.putMany([], repairedReports);
+    });
+
+    // Rescore the identifier records from the recomputed score state
+    const now = Date.now();
+    const scored = [];
+    await this.forEachPage(IDENTIFIERS_STORE, 'identifier', async (page) => {
+      const pageStates = page.map(record => ({
+        ...record,
+        ...fieldsFor(record.identifier),
+        ...(states.get(record.identifier) || this.scoreState([]))
+      }));
+      const scores = scoreAll(ScoreColumns.fromRecords(pageStates), this.scoringModel, now);
+      const repairedRecords = pageStates.map((state, i) => this.applyScore(state, {
+        safetyScore: Math.round(scores[i]),
+        riskLevel: riskLevelFor(scores[i])
+      }, now));
+      repairedRecords.forEach(({ identifier, riskLevel }) => scored.push({ identifier, riskLevel }));
+      await this.storage.putMany(repairedRecords, []);
+    });
+
+    this.statistics = this.computeStatistics(scored, reportColumns);
+    await this.storage.setMeta('statistics', this.statistics);
+    await this.storage.replaceRollups([...rollups.values()]);
+
+    this.membershipFilter = BloomFilter.from(scored.map(record => record.identifier));
+    await this.storage.setMeta('membershipFilter', this.membershipFilter.toStored());
+
+    // Cached reports and indexed display identifiers predate the refreshed feed
+    this.cache.clear();
+    this.resetReportIndexes();
+    this.broadcastChange({ type: 'all' });
+  }
+
+  // Score every stored identifier with each named model (see SCORING_MODELS),
+  // reporting time per pass, risk distribution and risk level changes
+  // relative to the first model. Stored scores are not changed.
+  async benchmarkScoringModels(modelNames = Object.keys(SCORING_MODELS), options = {}) {
+    await this.ready;
+    const models = modelNames.map(name => {
+      if (!SCORING_MODELS[name]) {
+        throw new Error(`Unknown scoring model: ${name}`);
+      }
+      return SCORING_MODELS[name];
+    });
+    return benchmarkModels(await this.storage.getAllIdentifiers(), models, options);
+  }
+
+  // Get identifier type (upi, phone, link)
+  getIdentifierType(identifier) {
+    if (identifier.startsWith('phone_')) return 'phone';
+    if (identifier.startsWith('link_')) return 'link';
+    return 'upi';
+  }
+
+  // Get display-friendly identifier (links show the first report's original URL)
+  getDisplayIdentifier(identifier, firstReport = null) {
+    if (identifier.startsWith('phone_')) {
+      return '+91 ' + identifier.replace('phone_', '');
+    }
+    if (identifier.startsWith('link_')) {
+      if (firstReport && firstReport.originalLink) {
+        return firstReport.originalLink;
+      }
+      return 'Payment Link';
+    }
+    return identifier;
+  }
+
+  // Get statistics for the database from the running totals
+  async getStatistics() {
+    await this.ready;
+
+    if (!this.statistics) {
+      this.statistics = await this.storage.getMeta('statistics');
+    }
+    if (!this.statistics) {
+      // Databases created before totals were tracked: compute them once
+      const [records, reportColumns] = await Promise.all([
+        this.storage.getAllIdentifiers(),
+        this.loadReportColumns()
+      ]);
+      this.statistics = this.computeStatistics(records, reportColumns);
+      await this.storage.setMeta('statistics', this.statistics);
+    }
+
+    const { totalIdentifiers, totalReports, totalAmount, riskCounts, categories } = this.statistics;
+    const highRiskCount = riskCounts.danger;
+    const moderateRiskCount = riskCounts.moderate;
+    const lowRiskCount = totalIdentifiers - highRiskCount - moderateRiskCount;
+
+    return {
+      totalIdentifiers,
+      totalReports,
+      totalAmount,
+      highRiskCount,
+      moderateRiskCount,
+      lowRiskCount,
+      categories: structuredClone(categories)
+    };
+  }
+
+  // Top k identifiers by report count ('reports'), amount lost ('amount') or
+  // risk ('risk', lowest safety score first). Reads k records off an index.
+  async getLeaderboard(by = 'reports', k = 10) {
+    await this.ready;
+    const leaderboard = LEADERBOARDS[by];
+    if (!leaderboard) {
+      throw new Error(`Unknown leaderboard: ${by}`);
+    }
+
+    const records = await this.storage.getIdentifiersByIndex(leaderboard.index, leaderboard.direction, k);
+    return records.map(record => ({
+      identifier: record.identifier,
+      identifierType: record.identifierType,
+      displayIdentifier: record.displayIdentifier,
+      reportCount: record.totalReports,
+      totalAmount: record.totalAmount || 0,
+      safetyScore: record.safetyScore,
+      riskLevel: record.riskLevel,
+      lastReported: record.lastReported
+    }));
+  }
+
+  // Report totals per hour, day or week from range.from to range.to (default
+  // now), read from the rollups; buckets with no reports are included as zeros
+  async getTrends({ from, to = Date.now() } = {}, granularity = 'day') {
+    await this.ready;
+    if (!GRANULARITIES.includes(granularity)) {
+      throw new Error(`Unknown trend granularity: ${granularity}`);
+    }
+    if (typeof from !== 'number' || from > to) {
+      throw new Error('getTrends needs a range with from <= to');
+    }
+
+    const stored = STORED_GRANULARITIES.includes(granularity) ? granularity : 'day';
+    const rows = await this.storage.getRollups(stored, bucketStart(bucketStart(from, granularity), stored), to);
+    return buildTrend(rows, from, to, granularity);
+  }
+
+  // Recompute every rollup from the stored reports, a page at a time
+  async rebuildRollups() {
+    const rollups = new Map();
+    await this.forEachPage(REPORTS_STORE, 'id', (page) => collectRollups(page, rollups));
+    await this.storage.replaceRollups([...rollups.values()]);
+  }
+
+  // Compute the running totals from scratch (reports as ReportColumns)
+  computeStatistics(records, reportColumns) {
+    const riskCounts = { safe: 0, moderate: 0, danger: 0 };
+    records.forEach(record => {
+      riskCounts[record.riskLevel || 'safe']++;
+    });
+
+    return {
+      totalIdentifiers: records.length,
+      totalReports: reportColumns.length,
+      totalAmount: reportColumns.totalAmount(),
+      riskCounts,
+      categories: this.getCategoryStats(reportColumns)
+    };
+  }
+
+  // Fold new reports into the running totals. changes lists each affected
+  // identifier's { previousRecord, record } (previousRecord null when new).
+  applyReportsToStatistics(statistics, reports, changes) {
+    const categories = { ...statistics.categories };
+    let totalAmount = statistics.totalAmount;
+    reports.forEach(report => {
+      const category = report.category || 'other';
+      const categoryTotals = categories[category] || { count: 0, amount: 0 };
+      categories[category] = {
+        count: categoryTotals.count + 1,
+        amount: categoryTotals.amount + (report.amount || 0)
+      };
+      totalAmount += report.amount || 0;
+    });
+
+    const riskCounts = { ...statistics.riskCounts };
+    let totalIdentifiers = statistics.totalIdentifiers;
+    changes.forEach(({ previousRecord, record }) => {
+      if (previousRecord) {
+        riskCounts[previousRecord.riskLevel || 'safe']--;
+      } else {
+        totalIdentifiers++;
+      }
+      riskCounts[record.riskLevel]++;
+    });
+
+    return {
+      totalIdentifiers,
+      totalReports: statistics.totalReports + reports.length,
+      totalAmount,
+      riskCounts,
+      categories
+    };
+  }
+
+  // Get category-wise statistics from report columns
+  getCategoryStats(reportColumns) {
+    return reportColumns.categoryStats();
+  }
+
+  // Build the search index on first use; later reports are added incrementally
+  async loadSearchIndex() {
+    if (!this.searchIndexPromise) {
+      // Read a page at a time, so the whole reports store is never held at once
+      this.searchIndexPromise = (async () => {
+        const index = new SearchIndex();
+        await this.forEachPage(REPORTS_STORE, 'id', (page) => page.forEach(report => index.add(report)));
+        return index;
+      })();
+    }
+
+    const index = await this.searchIndexPromise;
+
+    // Reports added by other tabs since the last search
+    if (this.pendingIndexIds.length) {
+      const reports = await this.storage.getReportsById(this.pendingIndexIds.splice(0));
+      reports.forEach(report => report && index.add(report));
+    }
+
+    return index;
+  }
+
+  // Build the report columns on first use, reading reports a page at a time
+  // so the full report objects are never held together
+  async loadReportColumns() {
+    if (!this.reportColumnsPromise) {
+      this.reportColumnsPromise = (async () => {
+        const columns = new ReportColumns();
+        await this.forEachPage(REPORTS_STORE, 'id', (page) => page.forEach(report => columns.add(report)));
+        return columns;
+      })();
+    }
+
+    const columns = await this.reportColumnsPromise;
+
+    // Reports added by other tabs since the last use
+    if (this.pendingColumnIds.length) {
+      const reports = await this.storage.getReportsById(this.pendingColumnIds.splice(0));
+      reports.forEach(report => report && columns.add(report));
+    }
+
+    return columns;
+  }
+
+  // Drop the search index and report columns; both are rebuilt on next use
+  resetReportIndexes() {
+    this.searchIndexPromise = null;
+    this.pendingIndexIds = [];
+    this.reportColumnsPromise = null;
+    this.pendingColumnIds = [];
+  }
+
+  // Search reports by various criteria. Text queries use the inverted index and
+  // rank by number of matched words, then recency; category and risk filters
+  // run over the report columns, so only matching reports are read. Aborting
+  // options.signal stops the search between storage reads.
+  async searchReports(query, category = null, riskLevel = null, limit = 1000, { signal } = {}) {
+    await this.ready;
+    throwIfAborted(signal);
+
+    const filters = { category, riskLevel };
+    const matchesFilters = (report) => {
+      const matchesCategory = !category || report.category === category;
+      
+      const matchesRiskLevel = !riskLevel || 
+        (riskLevel === 'high' && report.severity >= 4) ||
+        (riskLevel === 'medium' && report.severity === 3) ||
+        (riskLevel === 'low' && report.severity <= 2);
+      
+      return matchesCategory && matchesRiskLevel;
+    };
+
+    let ids;
+    if (tokenize(query).length === 0) {
+      if (!category && !riskLevel) {
+        return this.storage.getReportsByRecency(limit);
+      }
+      ids = (await this.loadReportColumns()).newestMatching(filters, limit);
+    } else {
+      ids = (await this.loadSearchIndex()).search(query);
+      if (category || riskLevel) {
+        ids = (await this.loadReportColumns()).filterIds(ids, filters);
+      }
+    }
+    throwIfAborted(signal);
+
+    const results = [];
+    for (let start = 0; start < ids.length && results.length < limit; start += SEARCH_BATCH) {
+      const reports = await this.storage.getReportsById(ids.slice(start, start + SEARCH_BATCH));
+      throwIfAborted(signal);
+      reports.forEach(report => {
+        // Columns let unknown ids through, so check the report itself too
+        if (report && matchesFilters(report) && results.length < limit) {
+          results.push(report);
+        }
+      });
+    }
+
+    return results;
+  }
+
+  // Clear all data (for testing)
+  async clearDatabase() {
+    await this.ready;
+    await this.storage.clear();
+    this.cache.clear();
+    this.statistics = null;
+    this.membershipFilter = null;
+    this.resetReportIndexes();
+    this.removeLegacyData();
+    this.ready = this.initializeDatabase();
+    await this.ready;
+  }
+}
+
+export default FraudDatabase;
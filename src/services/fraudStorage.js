@@ -0,0 +1,367 @@
+// Fraud Storage - IndexedDB storage engine for the fraud database
+const DB_NAME = 'upi-fraud-db';
+const DB_VERSION = 5;
+
+export const IDENTIFIERS_STORE = 'identifiers';
+export const REPORTS_STORE = 'reports';
+export const META_STORE = 'meta';
+export const ROLLUPS_STORE = 'rollups';
+
+// Wrap an IDBRequest in a promise
+export const requestToPromise = (request) => new Promise((resolve, reject) => {
+  request.onsuccess = () => resolve(request.result);
+  request.onerror = () => reject(request.error);
+});
+
+// Resolve once a transaction has committed
+const transactionDone = (transaction) => new Promise((resolve, reject) => {
+  transaction.oncomplete = () => resolve();
+  transaction.onerror = () => reject(transaction.error);
+  transaction.onabort = () => reject(transaction.error || new Error('Transaction aborted'));
+});
+
+export class FraudStorage {
+  constructor(name = DB_NAME) {
+    this.name = name;
+    this.dbPromise = null;
+  }
+
+  // Open (and upgrade) the database once, sharing the connection
+  open() {
+    if (!this.dbPromise) {
+      this.dbPromise = new Promise((resolve, reject) => {
+        const request = indexedDB.open(this.name, DB_VERSION);
+
+        request.onupgradeneeded = (event) => {
+          this.upgrade(request.result, request.transaction, event.oldVersion);
+        };
+        request.onsuccess = () => {
+          const db = request.result;
+          // Let a newer tab upgrade the schema instead of blocking it
+          db.onversionchange = () => db.close();
+          resolve(db);
+        };
+        request.onerror = () => reject(request.error);
+      });
+    }
+    return this.dbPromise;
+  }
+
+  // Schema migrations, applied in order from the stored version
+  upgrade(db, transaction, oldVersion) {
+    if (oldVersion < 1) {
+      // One record per identifier (summary only, reports live in their own store)
+      db.createObjectStore(IDENTIFIERS_STORE, { keyPath: 'identifier' });
+
+      const reports = db.createObjectStore(REPORTS_STORE, { keyPath: 'id' });
+      reports.createIndex('identifier', 'identifier');
+
+      db.createObjectStore(META_STORE);
+    }
+
+    if (oldVersion < 2) {
+      // Feed order: newest first via a reverse cursor, id breaks timestamp ties
+      transaction.objectStore(REPORTS_STORE).createIndex('timestamp', ['timestamp', 'id']);
+    }
+
+    if (oldVersion < 3) {
+      // Day each stored score was computed, so stale scores can be found without a scan
+      transaction.objectStore(IDENTIFIERS_STORE).createIndex('scoreDay', 'scoreDay');
+    }
+
+    if (oldVersion < 4) {
+      // Report totals per time bucket, one row per granularity and bucket start
+      db.createObjectStore(ROLLUPS_STORE, { keyPath: ['granularity', 'bucket'] });
+    }
+
+    if (oldVersion < 5) {
+      // Leaderboard orderings, kept sorted by IndexedDB as records are written
+      const identifiers = transaction.objectStore(IDENTIFIERS_STORE);
+      identifiers.createIndex('totalReports', 'totalReports');
+      identifiers.createIndex('totalAmount', 'totalAmount');
+      identifiers.createIndex('dangerRank', 'dangerRank');
+    }
+  }
+
+  // Run a callback inside a transaction and resolve with its result after commit
+  async run(storeNames, mode, callback) {
+    const db = await this.open();
+    const transaction = db.transaction(storeNames, mode);
+    const done = transactionDone(transaction);
+    const result = callback(transaction);
+    await done;
+    return result;
+  }
+
+  // Get one identifier record together with its reports in a single transaction
+  async getIdentifierWithReports(identifier) {
+    const db = await this.open();
+    const transaction = db.transaction([IDENTIFIERS_STORE, REPORTS_STORE]);
+    const [record, reports] = await Promise.all([
+      requestToPromise(transaction.objectStore(IDENTIFIERS_STORE).get(identifier)),
+      requestToPromise(transaction.objectStore(REPORTS_STORE).index('identifier').getAll(identifier))
+    ]);
+    return { record, reports };
+  }
+
+  // Get { record, reports } for several identifiers in one transaction, as a
+  // Map (null for identifiers with no record)
+  async getIdentifiersWithReports(identifiers) {
+    const db = await this.open();
+    const transaction = db.transaction([IDENTIFIERS_STORE, REPORTS_STORE]);
+    const identifierStore = transaction.objectStore(IDENTIFIERS_STORE);
+    const reportIndex = transaction.objectStore(REPORTS_STORE).index('identifier');
+
+    const entries = await Promise.all(identifiers.map(async identifier => {
+      const [record, reports] = await Promise.all([
+        requestToPromise(identifierStore.get(identifier)),
+        requestToPromise(reportIndex.getAll(identifier))
+      ]);
+      return [identifier, record ? { record, reports } : null];
+    }));
+    return new Map(entries);
+  }
+
+  async getAllIdentifierKeys() {
+    const db = await this.open();
+    const store = db.transaction(IDENTIFIERS_STORE).objectStore(IDENTIFIERS_STORE);
+    return requestToPromise(store.getAllKeys());
+  }
+
+  async getAllIdentifiers() {
+    const db = await this.open();
+    const store = db.transaction(IDENTIFIERS_STORE).objectStore(IDENTIFIERS_STORE);
+    return requestToPromise(store.getAll());
+  }
+
+  // Get reports by id, in the order given (undefined for missing ids)
+  async getReportsById(ids) {
+    const db = await this.open();
+    const store = db.transaction(REPORTS_STORE).objectStore(REPORTS_STORE);
+    return Promise.all(ids.map(id => requestToPromise(store.get(id))));
+  }
+
+  // Read up to `limit` reports newest first, strictly older than the
+  // [timestamp, id] position `before` when given
+  async getReportsByRecency(limit, before = null) {
+    const db = await this.open();
+    const index = db.transaction(REPORTS_STORE).objectStore(REPORTS_STORE).index('timestamp');
+    const range = before ? IDBKeyRange.upperBound(before, true) : null;
+
+    return new Promise((resolve, reject) => {
+      const reports = [];
+      const request = index.openCursor(range, 'prev');
+      request.onsuccess = () => {
+        const cursor = request.result;
+        if (cursor && reports.length < limit) {
+          reports.push(cursor.value);
+          cursor.continue();
+        } else {
+          resolve(reports);
+        }
+      };
+      request.onerror = () => reject(request.error);
+    });
+  }
+
+  // Read the first `limit` identifier records in an index's order, walking it
+  // from the top ('prev') or the bottom ('next')
+  async getIdentifiersByIndex(indexName, direction, limit) {
+    const db = await this.open();
+    const index = db.transaction(IDENTIFIERS_STORE).objectStore(IDENTIFIERS_STORE).index(indexName);
+
+    return new Promise((resolve, reject) => {
+      const records = [];
+      const request = index.openCursor(null, direction);
+      request.onsuccess = () => {
+        const cursor = request.result;
+        if (cursor && records.length < limit) {
+          records.push(cursor.value);
+          cursor.continue();
+        } else {
+          resolve(records);
+        }
+      };
+      request.onerror = () => reject(request.error);
+    });
+  }
+
+  // Write new reports in one read-modify-write transaction, so concurrent
+  // writers (other calls or other tabs) never overwrite each other's counts.
+  // Reads the records for `identifiers` and which of `reportIds` are already
+  // stored, then build(records, existingIds) returns what to write:
+  // { records, reports, metaUpdates, rollupDeltas, updateStatistics }. Each
+  // meta update maps the stored value to the one to write, read in the same
+  // transaction so another tab's write is never overwritten. Rollup
+  // deltas are combined into the stored rollups with mergeRollup, and the stored
+  // statistics (if present) are updated in the same transaction. Resolves with
+  // build's result plus the new statistics.
+  putReports(identifiers, reportIds, build, { mergeRollup }) {
+    const stores = [IDENTIFIERS_STORE, REPORTS_STORE, META_STORE, ROLLUPS_STORE];
+    return this.run(stores, 'readwrite', (transaction) => {
+      const identifierStore = transaction.objectStore(IDENTIFIERS_STORE);
+      const reportStore = transaction.objectStore(REPORTS_STORE);
+      const result = { statistics: undefined };
+
+      const write = (records, existingIds) => {
+        const built = build(records, existingIds);
+        Object.assign(result, built);
+        built.records.forEach(record => identifierStore.put(record));
+        built.reports.forEach(report => reportStore.put(report));
+
+        const rollupStore = transaction.objectStore(ROLLUPS_STORE);
+        built.rollupDeltas.forEach(delta => {
+          const request = rollupStore.get([delta.granularity, delta.bucket]);
+          request.onsuccess = () => {
+            rollupStore.put(request.result ? mergeRollup(request.result, delta) : delta);
+          };
+        });
+
+        const meta = transaction.objectStore(META_STORE);
+        Object.entries(built.metaUpdates).forEach(([key, update]) => {
+          const stored = meta.get(key);
+          stored.onsuccess = () => meta.put(update(stored.result), key);
+        });
+        const request = meta.get('statistics');
+        request.onsuccess = () => {
+          if (request.result) {
+            result.statistics = built.updateStatistics(request.result);
+            meta.put(result.statistics, 'statistics');
+          }
+        };
+      };
+
+      const records = new Map();
+      const existingIds = new Set();
+      let pending = identifiers.length + reportIds.length;
+      const settle = () => {
+        if (--pending === 0) write(records, existingIds);
+      };
+      if (pending === 0) {
+        write(records, existingIds);
+      }
+      identifiers.forEach(identifier => {
+        const request = identifierStore.get(identifier);
+        request.onsuccess = () => {
+          if (request.result) records.set(identifier, request.result);
+          settle();
+        };
+      });
+      reportIds.forEach(id => {
+        const request = reportStore.getKey(id);
+        request.onsuccess = () => {
+          if (request.result !== undefined) existingIds.add(id);
+          settle();
+        };
+      });
+      return result;
+    });
+  }
+
+  // Rescore identifier records in one read-modify-write transaction, so a
+  // concurrent report write is never overwritten with stale counts. `selection`
+  // is either a list of identifiers or { staleBefore, limit }: up to `limit`
+  // records whose scoreDay is older than staleBefore. rescore(record) returns the
+  // replacement, or null to keep the record. Resolves with { changes, statistics }.
+  rescoreRecords(selection, rescore, updateStatistics) {
+    return this.run([IDENTIFIERS_STORE, META_STORE], 'readwrite', (transaction) => {
+      const store = transaction.objectStore(IDENTIFIERS_STORE);
+      const meta = transaction.objectStore(META_STORE);
+      const result = { changes: [], statistics: undefined };
+
+      const apply = (records) => {
+        records.forEach(previousRecord => {
+          const record = previousRecord && rescore(previousRecord);
+          if (record) {
+            store.put(record);
+            result.changes.push({ previousRecord, record });
+          }
+        });
+        if (!result.changes.length) return;
+
+        const request = meta.get('statistics');
+        request.onsuccess = () => {
+          if (request.result) {
+            result.statistics = updateStatistics(request.result, result.changes);
+            meta.put(result.statistics, 'statistics');
+          }
+        };
+      };
+
+      if (Array.isArray(selection)) {
+        const records = [];
+        let pending = selection.length;
+        selection.forEach((identifier, i) => {
+          const request = store.get(identifier);
+          request.onsuccess = () => {
+            records[i] = request.result;
+            if (--pending === 0) apply(records);
+          };
+        });
+      } else {
+        const range = IDBKeyRange.upperBound(selection.staleBefore, true);
+        const request = store.index('scoreDay').getAll(range, selection.limit);
+        request.onsuccess = () => apply(request.result);
+      }
+      return result;
+    });
+  }
+
+  // Stored rollups of one granularity with bucket starts between from and to
+  async getRollups(granularity, from, to) {
+    const db = await this.open();
+    const store = db.transaction(ROLLUPS_STORE).objectStore(ROLLUPS_STORE);
+    return requestToPromise(store.getAll(IDBKeyRange.bound([granularity, from], [granularity, to])));
+  }
+
+  // Replace every stored rollup
+  replaceRollups(rollups) {
+    return this.run(ROLLUPS_STORE, 'readwrite', (transaction) => {
+      const store = transaction.objectStore(ROLLUPS_STORE);
+      store.clear();
+      rollups.forEach(rollup => store.put(rollup));
+    });
+  }
+
+  // Read up to `count` values from a store in key order, after the key `after`
+  async getPage(storeName, after, count) {
+    const db = await this.open();
+    const store = db.transaction(storeName).objectStore(storeName);
+    const range = after === null ? null : IDBKeyRange.lowerBound(after, true);
+    return requestToPromise(store.getAll(range, count));
+  }
+
+  // Write many records and reports in one transaction
+  putMany(records, reports) {
+    return this.run([IDENTIFIERS_STORE, REPORTS_STORE], 'readwrite', (transaction) => {
+      const identifierStore = transaction.objectStore(IDENTIFIERS_STORE);
+      const reportStore = transaction.objectStore(REPORTS_STORE);
+      records.forEach(record => identifierStore.put(record));
+      reports.forEach(report => reportStore.put(report));
+    });
+  }
+
+  async getMeta(key) {
+    const db = await this.open();
+    const store = db.transaction(META_STORE).objectStore(META_STORE);
+    return requestToPromise(store.get(key));
+  }
+
+  setMeta(key, value) {
+    return this.run(META_STORE, 'readwrite', (transaction) => {
+      transaction.objectStore(META_STORE).put(value, key);
+    });
+  }
+
+  // Remove every identifier, report, rollup and meta entry
+  clear() {
+    return this.run([IDENTIFIERS_STORE, REPORTS_STORE, META_STORE, ROLLUPS_STORE], 'readwrite', (transaction) => {
+      transaction.objectStore(IDENTIFIERS_STORE).clear();
+      transaction.objectStore(REPORTS_STORE).clear();
+      transaction.objectStore(META_STORE).clear();
+      transaction.objectStore(ROLLUPS_STORE).clear();
+    });
+  }
+}
+
+export default FraudStorage;
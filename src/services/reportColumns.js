@@ -0,0 +1,151 @@
+// Report Columns - columnar, typed-array copy of every report for analytics.
+// Numbers live in typed arrays and strings (category, identifier type) as small
+// dictionary codes, so filters and aggregates are tight passes over a few arrays.
+import Dictionary from './dictionary.js';
+
+const INITIAL_CAPACITY = 1024;
+
+// Code 0 means the report has no category (counted as 'other' in stats)
+const NO_CATEGORY = 0;
+
+// Severity bands used by the risk filter
+const RISK_BANDS = {
+  high: (severity) => severity >= 4,
+  medium: (severity) => severity === 3,
+  low: (severity) => severity <= 2
+};
+
+export class ReportColumns {
+  constructor(capacity = INITIAL_CAPACITY) {
+    this.length = 0;
+    this.ids = [];
+    this.rows = new Map(); // report id -> row
+    this.timestamp = new Float64Array(capacity);
+    this.amount = new Float64Array(capacity);
+    this.severity = new Float32Array(capacity); // NaN when missing, so it matches no risk band
+    this.category = new Uint16Array(capacity);
+    this.identifierType = new Uint8Array(capacity);
+    this.categories = new Dictionary([undefined]);
+    this.identifierTypes = new Dictionary();
+
+    // Rows newest first; rows added since it was built are merged in on demand
+    this.recency = new Uint32Array(0);
+    this.unsortedFrom = 0;
+  }
+
+  get capacity() {
+    return this.timestamp.length;
+  }
+
+  grow() {
+    const resize = (column) => {
+      const grown = new column.constructor(column.length * 2);
+      grown.set(column);
+      return grown;
+    };
+    this.timestamp = resize(this.timestamp);
+    this.amount = resize(this.amount);
+    this.severity = resize(this.severity);
+    this.category = resize(this.category);
+    this.identifierType = resize(this.identifierType);
+  }
+
+  add(report) {
+    if (this.rows.has(report.id)) return;
+    if (this.length === this.capacity) this.grow();
+
+    const row = this.length++;
+    this.ids.push(report.id);
+    this.rows.set(report.id, row);
+    this.timestamp[row] = report.timestamp || 0;
+    this.amount[row] = report.amount || 0;
+    this.severity[row] = typeof report.severity === 'number' ? report.severity : NaN;
+    this.category[row] = report.category ? this.categories.encode(report.category) : NO_CATEGORY;
+    this.identifierType[row] = this.identifierTypes.encode(report.identifierType);
+  }
+
+  // Row predicate for { category, riskLevel } filters (either may be null)
+  matcher({ category = null, riskLevel = null } = {}) {
+    const categoryCode = category ? this.categories.codes.get(category) : null;
+    if (categoryCode === undefined) return () => false; // no report has it
+    const inBand = riskLevel ? RISK_BANDS[riskLevel] : null;
+
+    return (row) =>
+      (categoryCode === null || this.category[row] === categoryCode) &&
+      (!inBand || inBand(this.severity[row]));
+  }
+
+  // The ids passing the filters, in order; unknown ids pass, for the caller to check
+  filterIds(ids, filters) {
+    const matches = this.matcher(filters);
+    return ids.filter(id => {
+      const row = this.rows.get(id);
+      return row === undefined || matches(row);
+    });
+  }
+
+  // Ids of the newest `limit` reports passing the filters
+  newestMatching(filters, limit) {
+    const matches = this.matcher(filters);
+    const order = this.sortedByRecency();
+    const ids = [];
+    for (let i = 0; i < order.length && ids.length < limit; i++) {
+      if (matches(order[i])) ids.push(this.ids[order[i]]);
+    }
+    return ids;
+  }
+
+  // Newer timestamp first, then larger id, matching the feed's index order
+  compareRecency(a, b) {
+    return this.timestamp[b] - this.timestamp[a] ||
+      (this.ids[b] > this.ids[a] ? 1 : this.ids[b] < this.ids[a] ? -1 : 0);
+  }
+
+  sortedByRecency() {
+    if (this.unsortedFrom === this.length) return this.recency;
+
+    const added = Uint32Array.from({ length: this.length - this.unsortedFrom }, (_, i) => this.unsortedFrom + i)
+      .sort((a, b) => this.compareRecency(a, b));
+    const merged = new Uint32Array(this.length);
+    let i = 0;
+    let j = 0;
+    for (let k = 0; k < merged.length; k++) {
+      merged[k] = j >= added.length || (i < this.recency.length && this.compareRecency(this.recency[i], added[j]) <= 0)
+        ? this.recency[i++]
+        : added[j++];
+    }
+
+    this.recency = merged;
+    this.unsortedFrom = this.length;
+    return merged;
+  }
+
+  // { category: { count, amount } } over every report
+  categoryStats() {
+    const counts = new Uint32Array(this.categories.values.length);
+    const amounts = new Float64Array(this.categories.values.length);
+    for (let row = 0; row < this.length; row++) {
+      counts[this.category[row]]++;
+      amounts[this.category[row]] += this.amount[row];
+    }
+
+    const categories = {};
+    this.categories.values.forEach((value, code) => {
+      if (!counts[code]) return;
+      const category = value || 'other';
+      const totals = categories[category] || { count: 0, amount: 0 };
+      categories[category] = { count: totals.count + counts[code], amount: totals.amount + amounts[code] };
+    });
+    return categories;
+  }
+
+  totalAmount() {
+    let total = 0;
+    for (let row = 0; row < this.length; row++) {
+      total += this.amount[row];
+    }
+    return total;
+  }
+}
+
+export default ReportColumns;
@@ -0,0 +1,84 @@
+// Rescore Scheduler - keeps stored safety scores current as recency decay moves
+// them, rescoring stale identifiers in small chunks whenever the thread is idle
+const DAY_MS = 1000 * 60 * 60 * 24;
+
+// Identifiers rescored per transaction
+const CHUNK_SIZE = 100;
+
+// Don't start another chunk with less idle time than this left (ms)
+const MIN_IDLE_MS = 4;
+
+// Workers have no requestIdleCallback; a short timer stands in for it and
+// grants each run one frame's worth of time
+const requestIdle = typeof requestIdleCallback === 'function'
+  ? (callback) => requestIdleCallback(callback, { timeout: 10000 })
+  : (callback) => setTimeout(() => {
+    const start = Date.now();
+    callback({ didTimeout: false, timeRemaining: () => Math.max(0, 16 - (Date.now() - start)) });
+  }, 50);
+
+const cancelIdle = typeof cancelIdleCallback === 'function' ? cancelIdleCallback : clearTimeout;
+
+export class RescoreScheduler {
+  // engine.rescoreStale(limit) rescores up to limit stale identifiers and
+  // returns how many it rescored
+  constructor(engine, { chunkSize = CHUNK_SIZE } = {}) {
+    this.engine = engine;
+    this.chunkSize = chunkSize;
+    this.running = false;
+    this.idleHandle = null;
+    this.wakeTimer = null;
+  }
+
+  start() {
+    if (this.running) return;
+    this.running = true;
+    this.schedule();
+  }
+
+  stop() {
+    this.running = false;
+    if (this.idleHandle !== null) cancelIdle(this.idleHandle);
+    clearTimeout(this.wakeTimer);
+    this.idleHandle = null;
+    this.wakeTimer = null;
+  }
+
+  schedule() {
+    this.idleHandle = requestIdle((deadline) => this.runChunks(deadline));
+  }
+
+  // Rescore chunks while idle time remains, then yield until the next idle
+  // period; once nothing is stale, sleep until scores next decay (midnight UTC)
+  async runChunks(deadline) {
+    this.idleHandle = null;
+    if (!this.running) return;
+
+    try {
+      do {
+        const rescored = await this.engine.rescoreStale(this.chunkSize);
+        if (rescored < this.chunkSize) {
+          this.sleepUntilTomorrow();
+          return;
+        }
+      } while (this.running && deadline.timeRemaining() > MIN_IDLE_MS);
+    } catch (error) {
+      console.error('Background rescoring failed:', error);
+      this.sleepUntilTomorrow();
+      return;
+    }
+
+    if (this.running) this.schedule();
+  }
+
+  sleepUntilTomorrow() {
+    if (!this.running) return;
+    const untilTomorrow = DAY_MS - (Date.now() % DAY_MS);
+    this.wakeTimer = setTimeout(() => {
+      this.wakeTimer = null;
+      this.schedule();
+    }, untilTomorrow + 1000);
+  }
+}
+
+export default RescoreScheduler;
@@ -0,0 +1,99 @@
+// Rollups - hourly and daily report totals, updated as reports are written,
+// so trend queries read one row per bucket instead of every report
+const HOUR_MS = 1000 * 60 * 60;
+const DAY_MS = HOUR_MS * 24;
+const WEEK_MS = DAY_MS * 7;
+
+// 1970-01-01 was a Thursday; shifting by 4 days starts weeks on Monday
+const WEEK_OFFSET = DAY_MS * 4;
+
+export const GRANULARITIES = ['hour', 'day', 'week'];
+
+// Granularities kept in storage; weeks are summed from days
+export const STORED_GRANULARITIES = ['hour', 'day'];
+
+// Start (ms, UTC) of the bucket a timestamp falls in
+export const bucketStart = (time, granularity) => {
+  if (granularity === 'week') {
+    return Math.floor((time - WEEK_OFFSET) / WEEK_MS) * WEEK_MS + WEEK_OFFSET;
+  }
+  const size = granularity === 'hour' ? HOUR_MS : DAY_MS;
+  return Math.floor(time / size) * size;
+};
+
+const nextBucket = (start, granularity) =>
+  start + (granularity === 'hour' ? HOUR_MS : granularity === 'day' ? DAY_MS : WEEK_MS);
+
+const emptyRollup = (granularity, bucket) => ({
+  granularity,
+  bucket,
+  count: 0,
+  amount: 0,
+  severitySum: 0,
+  categories: {},
+  identifierTypes: {}
+});
+
+const addTotals = (totals = { count: 0, amount: 0, severitySum: 0 }, { count, amount, severitySum }) => ({
+  count: totals.count + count,
+  amount: totals.amount + amount,
+  severitySum: totals.severitySum + severitySum
+});
+
+// Add one rollup's totals into another (mutates and returns target)
+export const mergeRollup = (target, source) => {
+  Object.assign(target, addTotals(target, source));
+  Object.entries(source.categories).forEach(([category, totals]) => {
+    target.categories[category] = addTotals(target.categories[category], totals);
+  });
+  Object.entries(source.identifierTypes).forEach(([type, totals]) => {
+    target.identifierTypes[type] = addTotals(target.identifierTypes[type], totals);
+  });
+  return target;
+};
+
+// Fold reports into a Map of rollups keyed by granularity and bucket (a new
+// Map unless one is given), one rollup per stored granularity per bucket
+export const collectRollups = (reports, rollups = new Map()) => {
+  reports.forEach(report => {
+    const totals = { count: 1, amount: report.amount || 0, severitySum: report.severity || 0 };
+    const single = {
+      ...totals,
+      categories: { [report.category || 'other']: totals },
+      identifierTypes: { [report.identifierType || 'upi']: totals }
+    };
+
+    STORED_GRANULARITIES.forEach(granularity => {
+      const bucket = bucketStart(report.timestamp, granularity);
+      const key = `${granularity}:${bucket}`;
+      if (!rollups.has(key)) {
+        rollups.set(key, emptyRollup(granularity, bucket));
+      }
+      mergeRollup(rollups.get(key), single);
+    });
+  });
+  return rollups;
+};
+
+// One entry per bucket from `from` to `to` (zeros where nothing was reported),
+// summing stored rollups into coarser buckets when granularity is 'week'
+export const buildTrend = (rows, from, to, granularity) => {
+  const buckets = new Map();
+  for (let start = bucketStart(from, granularity); start <= to; start = nextBucket(start, granularity)) {
+    buckets.set(start, emptyRollup(granularity, start));
+  }
+
+  rows.forEach(row => {
+    const bucket = buckets.get(bucketStart(row.bucket, granularity));
+    if (bucket) mergeRollup(bucket, row);
+  });
+
+  return [...buckets.values()].map(({ bucket, count, amount, severitySum, categories, identifierTypes }) => ({
+    start: bucket,
+    count,
+    amount,
+    avgSeverity: count ? severitySum / count : 0,
+    categories,
+    identifierTypes
+  }));
+};
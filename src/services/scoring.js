@@ -0,0 +1,158 @@
+// Scoring - safety score models over typed-array feature columns.
+// A model scores row i of a ScoreColumns table; scoreAll() runs it over every
+// row in one loop, and scoreRecord() scores a single identifier record.
+const DAY_MS = 1000 * 60 * 60 * 24;
+
+// Score for an identifier with no reports
+const UNREPORTED_SCORE = 85;
+
+export const riskLevelFor = (safetyScore) =>
+  safetyScore > 70 ? 'safe' : safetyScore > 40 ? 'moderate' : 'danger';
+
+// Per-identifier features, one typed-array column each. categoryCounts is a
+// row-major length x categories.length matrix of report counts per category.
+export class ScoreColumns {
+  constructor(length, categories = []) {
+    this.length = length;
+    this.categories = categories;
+    this.count = new Uint32Array(length);
+    this.severitySum = new Float32Array(length);
+    this.amount = new Float64Array(length);
+    this.lastReported = new Float64Array(length); // ms timestamps overflow float32 precision
+    this.categoryCounts = new Uint32Array(length * categories.length);
+  }
+
+  // Columns for identifier records ({ totalReports, severitySum, totalAmount,
+  // lastReported, categoryCounts }), in the order given
+  static fromRecords(records) {
+    const categories = new Set();
+    records.forEach(record => {
+      Object.keys(record.categoryCounts || {}).forEach(category => categories.add(category));
+    });
+
+    const columns = new ScoreColumns(records.length, [...categories]);
+    records.forEach((record, i) => columns.set(i, record));
+    return columns;
+  }
+
+  set(i, { totalReports, severitySum, totalAmount, lastReported, categoryCounts = {} }) {
+    this.count[i] = totalReports || 0;
+    this.severitySum[i] = severitySum || 0;
+    this.amount[i] = totalAmount || 0;
+    this.lastReported[i] = lastReported || 0;
+
+    const width = this.categories.length;
+    this.categories.forEach((category, c) => {
+      this.categoryCounts[i * width + c] = categoryCounts[category] || 0;
+    });
+  }
+}
+
+// Older reports count for less, down to half weight after 30 days
+const recencyFactor = (columns, i, now) =>
+  Math.max(0.5, 1 - (now - columns.lastReported[i]) / DAY_MS / 30);
+
+// The original model: report count and average severity, decayed by recency
+export const recencyModel = {
+  name: 'recency',
+  score(columns, i, now) {
+    const totalReports = columns.count[i];
+    const avgSeverity = columns.severitySum[i] / totalReports;
+    return Math.max(0, 100 - (totalReports * 15 + avgSeverity * 15) * recencyFactor(columns, i, now));
+  }
+};
+
+// Severity scaled by how dangerous the identifier's report categories are
+// (unlisted categories weigh 1)
+export const createCategoryWeightedModel = (weights = {
+  phishing: 1.25,
+  link_fraud: 1.2,
+  fake_qr: 1.15,
+  payment_fraud: 1.1,
+  phone_fraud: 1.1,
+  fake_merchant: 1,
+  other: 0.8
+}) => ({
+  name: 'categoryWeighted',
+  // Weight vector in the columns' category order, built once per run
+  prepare(columns) {
+    return Float32Array.from(columns.categories, category => weights[category] ?? 1);
+  },
+  score(columns, i, now, categoryWeights) {
+    const totalReports = columns.count[i];
+    const width = categoryWeights.length;
+    let weighted = 0;
+    let counted = 0;
+    for (let c = 0; c < width; c++) {
+      const count = columns.categoryCounts[i * width + c];
+      weighted += count * categoryWeights[c];
+      counted += count;
+    }
+    const categoryWeight = counted ? weighted / counted : 1;
+    const avgSeverity = (columns.severitySum[i] / totalReports) * categoryWeight;
+    return Math.max(0, 100 - (totalReports * 15 + avgSeverity * 15) * recencyFactor(columns, i, now));
+  }
+});
+
+// Severity scaled up with the average amount lost per report (x1.15 at
+// ₹1,000, x1.5 at ₹10,000)
+export const amountWeightedModel = {
+  name: 'amountWeighted',
+  score(columns, i, now) {
+    const totalReports = columns.count[i];
+    const amountFactor = 1 + Math.log10(1 + columns.amount[i] / totalReports / 1000) / 2;
+    const avgSeverity = (columns.severitySum[i] / totalReports) * amountFactor;
+    return Math.max(0, 100 - (totalReports * 15 + avgSeverity * 15) * recencyFactor(columns, i, now));
+  }
+};
+
+export const SCORING_MODELS = {
+  recency: recencyModel,
+  categoryWeighted: createCategoryWeightedModel(),
+  amountWeighted: amountWeightedModel
+};
+
+export const DEFAULT_MODEL = recencyModel;
+
+// Unrounded scores for every row, in one pass
+export const scoreAll = (columns, model = DEFAULT_MODEL, now = Date.now()) => {
+  const context = model.prepare ? model.prepare(columns) : undefined;
+  const scores = new Float64Array(columns.length);
+  for (let i = 0; i < columns.length; i++) {
+    scores[i] = columns.count[i] ? model.score(columns, i, now, context) : UNREPORTED_SCORE;
+  }
+  return scores;
+};
+
+// { safetyScore, riskLevel } for one identifier record
+export const scoreRecord = (record, model = DEFAULT_MODEL, now = Date.now()) => {
+  const [score] = scoreAll(ScoreColumns.fromRecords([record]), model, now);
+  return { safetyScore: Math.round(score), riskLevel: riskLevelFor(score) };
+};
+
+// Score the same records with each model, timing `runs` passes of scoreAll.
+// Risk level changes are counted against the first model.
+export const benchmarkModels = (records, models = Object.values(SCORING_MODELS), { runs = 5, now = Date.now() } = {}) => {
+  const columns = ScoreColumns.fromRecords(records);
+  let baseline = null;
+
+  return models.map(model => {
+    let scores;
+    const start = performance.now();
+    for (let run = 0; run < runs; run++) {
+      scores = scoreAll(columns, model, now);
+    }
+    const msPerRun = (performance.now() - start) / runs;
+
+    const riskLevels = Array.from(scores, riskLevelFor);
+    const riskCounts = { safe: 0, moderate: 0, danger: 0 };
+    riskLevels.forEach(riskLevel => { riskCounts[riskLevel]++; });
+
+    const changedFromBaseline = baseline
+      ? riskLevels.reduce((changed, riskLevel, i) => changed + (riskLevel !== baseline[i]), 0)
+      : 0;
+    baseline = baseline || riskLevels;
+
+    return { model: model.name, identifiers: columns.length, msPerRun, riskCounts, changedFromBaseline };
+  });
+};
@@ -0,0 +1,81 @@
+// Search Index - in-memory inverted index over report text
+const TOKEN_PATTERN = /[\p{L}\p{N}]+/gu;
+
+// Split text into lowercase word tokens
+export const tokenize = (text) => (text ? text.toLowerCase().match(TOKEN_PATTERN) || [] : []);
+
+export class SearchIndex {
+  constructor() {
+    this.postings = new Map(); // token -> Set of report ids
+    this.sortedTokens = []; // every indexed token, sorted for prefix lookups
+    this.timestamps = new Map(); // report id -> timestamp, for recency ranking
+  }
+
+  get size() {
+    return this.timestamps.size;
+  }
+
+  // Index a report's description and display identifier
+  add(report) {
+    if (this.timestamps.has(report.id)) return;
+    this.timestamps.set(report.id, report.timestamp);
+
+    const tokens = new Set([
+      ...tokenize(report.description),
+      ...tokenize(report.displayIdentifier)
+    ]);
+
+    tokens.forEach(token => {
+      let ids = this.postings.get(token);
+      if (!ids) {
+        ids = new Set();
+        this.postings.set(token, ids);
+        this.sortedTokens.splice(this.lowerBound(token), 0, token);
+      }
+      ids.add(report.id);
+    });
+  }
+
+  // First position in sortedTokens that is >= token
+  lowerBound(token) {
+    let low = 0;
+    let high = this.sortedTokens.length;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (this.sortedTokens[mid] < token) low = mid + 1;
+      else high = mid;
+    }
+    return low;
+  }
+
+  // Report ids containing a token that starts with prefix
+  matchPrefix(prefix) {
+    const ids = new Set();
+    for (let i = this.lowerBound(prefix); i < this.sortedTokens.length; i++) {
+      const token = this.sortedTokens[i];
+      if (!token.startsWith(prefix)) break;
+      this.postings.get(token).forEach(id => ids.add(id));
+    }
+    return ids;
+  }
+
+  // Report ids matching any query token (as a prefix), ranked by the number of
+  // query tokens matched and then by recency
+  search(query) {
+    const queryTokens = [...new Set(tokenize(query))];
+    const matchCounts = new Map();
+
+    queryTokens.forEach(token => {
+      this.matchPrefix(token).forEach(id => {
+        matchCounts.set(id, (matchCounts.get(id) || 0) + 1);
+      });
+    });
+
+    return [...matchCounts.keys()].sort((a, b) =>
+      matchCounts.get(b) - matchCounts.get(a) ||
+      this.timestamps.get(b) - this.timestamps.get(a)
+    );
+  }
+}
+
+export default SearchIndex;
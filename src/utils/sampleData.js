@@ -1,7 +1,7 @@
 import fraudDB from '../services/fraudDatabase';
 
 // Function to add some sample reports for demonstration
-export const addSampleReports = () => {
+export const addSampleReports = async () => {
   try {
     // Add a few sample reports to demonstrate the system
     const sampleReports = [
@@ -27,9 +27,9 @@ export const addSampleReports = () => {
       }
     ];
 
-    sampleReports.forEach(({ identifier, reportData }) => {
-      fraudDB.addFraudReport(identifier, reportData);
-    });
+    for (const { identifier, reportData } of sampleReports) {
+      await fraudDB.addFraudReport(identifier, reportData);
+    }
 
     console.log('Sample reports added to demonstrate functionality');
   } catch (error) {
@@ -0,0 +1,229 @@
+// Synthetic Data - deterministic, seedable fraud reports for benchmarks and
+// soak tests. Reports are generated one at a time, so millions can be streamed
+// into the bulk import path or an NDJSON file without building them in memory.
+// The same seed and options (including `now`) always give the same reports.
+
+const DAY_MS = 1000 * 60 * 60 * 24;
+
+// Categories offered by the fraud reporting form; phone and link reports use
+// the categories the phone and link checkers file them under
+export const REPORT_CATEGORIES = ['payment_fraud', 'fake_qr', 'phishing', 'fake_merchant', 'other'];
+const UPI_CATEGORY_WEIGHTS = [0.4, 0.2, 0.2, 0.12, 0.08];
+
+// Severity 1-5, skewed toward moderate and high
+const SEVERITY_WEIGHTS = [0.1, 0.2, 0.35, 0.22, 0.13];
+
+const UPI_HANDLES = ['paytm', 'ybl', 'okaxis', 'oksbi', 'okhdfcbank', 'ibl', 'apl'];
+const UPI_NAMES = ['merchant', 'store', 'refund', 'support', 'kyc', 'shop', 'pay', 'help', 'offers'];
+const LINK_DOMAINS = ['pay-secure.in', 'upi-refund.co', 'kyc-update.online', 'rewards-pay.net'];
+
+const DESCRIPTIONS = {
+  payment_fraud: [
+    'Took payment for {item} and never delivered',
+    'Charged extra amount without consent for {item}',
+    'Asked to pay advance for {item} then blocked number'
+  ],
+  fake_qr: [
+    'QR code at shop sent money to a different account',
+    'Scanned QR to receive {item} refund but money was debited',
+    'Fake QR sticker pasted over the merchant QR'
+  ],
+  phishing: [
+    'Pretended to be from bank and asked for OTP',
+    'Fake KYC update message asked for UPI PIN',
+    'Claimed lottery prize and asked for processing fee'
+  ],
+  fake_merchant: [
+    'Fake online store selling {item} at huge discount',
+    'Merchant account impersonating a known brand for {item}',
+    'Fake cashback offer on {item} purchase'
+  ],
+  other: [
+    'Suspicious collect request for {item}',
+    'Unknown person asked to approve a payment request',
+    'Job offer that required a registration fee'
+  ],
+  phone_fraud: [
+    'Fake call claiming to be from bank, asked for PIN',
+    'Caller said electricity would be cut unless paid today',
+    'Courier call asking to pay customs fee for {item}'
+  ],
+  link_fraud: [
+    'Payment link for {item} refund stole money',
+    'Link sent on WhatsApp asked for card and UPI details',
+    'Fake KYC link redirecting to payment page'
+  ]
+};
+const ITEMS = ['mobile phone', 'electricity bill', 'train ticket', 'rent deposit', 'laptop', 'gas cylinder', 'insurance', 'loan'];
+
+// Deterministic 32-bit PRNG (mulberry32), uniform in [0, 1)
+export const createRandom = (seed = 1) => {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6D2B79F5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+};
+
+// Integer hash, used so an identifier's type and name depend only on its rank
+const hash = (value) => {
+  let h = Math.imul(value ^ (value >>> 16), 0x45d9f3b);
+  h = Math.imul(h ^ (h >>> 16), 0x45d9f3b);
+  return (h ^ (h >>> 16)) >>> 0;
+};
+
+const pick = (random, values, weights) => {
+  let u = random();
+  for (let i = 0; i < values.length - 1; i++) {
+    u -= weights[i];
+    if (u < 0) return values[i];
+  }
+  return values[values.length - 1];
+};
+
+// Standard normal sample (Box-Muller)
+const gaussian = (random) => Math.sqrt(-2 * Math.log(1 - random())) * Math.cos(2 * Math.PI * random());
+
+// Zipf sampler over ranks 1..n, P(k) proportional to k^-exponent, using
+// rejection-inversion (Hörmann & Derflinger) so no per-rank table is needed
+export const createZipf = (n, exponent = 1.1, random = createRandom()) => {
+  const helper1 = (x) => (Math.abs(x) > 1e-8 ? Math.log1p(x) / x : 1 - x * (0.5 - x * (1 / 3 - 0.25 * x)));
+  const helper2 = (x) => (Math.abs(x) > 1e-8 ? Math.expm1(x) / x : 1 + x * 0.5 * (1 + x / 3 * (1 + 0.25 * x)));
+  const h = (x) => Math.exp(-exponent * Math.log(x));
+  const hIntegral = (x) => {
+    const logX = Math.log(x);
+    return helper2((1 - exponent) * logX) * logX;
+  };
+  const hIntegralInverse = (x) => {
+    const t = Math.max(-1, x * (1 - exponent));
+    return Math.exp(helper1(t) * x);
+  };
+
+  const hIntegralX1 = hIntegral(1.5) - 1;
+  const hIntegralN = hIntegral(n + 0.5);
+  const squeeze = 2 - hIntegralInverse(hIntegral(2.5) - h(2));
+
+  return () => {
+    while (true) {
+      const u = hIntegralN + random() * (hIntegralX1 - hIntegralN);
+      const x = hIntegralInverse(u);
+      const k = Math.min(n, Math.max(1, Math.round(x)));
+      if (k - x <= squeeze || u >= hIntegral(k + 0.5) - h(k)) {
+        return k;
+      }
+    }
+  };
+};
+
+// The identifier with a given offender rank (1 is reported most often):
+// { identifier, type, link } with type 'upi', 'phone' or 'link'
+export const syntheticIdentifier = (rank, { identifierMix = { upi: 0.7, phone: 0.2, link: 0.1 } } = {}) => {
+  const bits = hash(rank);
+  const share = (bits % 1000) / 1000;
+  const name = UPI_NAMES[(bits >>> 10) % UPI_NAMES.length];
+
+  if (share < identifierMix.upi) {
+    return { identifier: `${name}${rank}@${UPI_HANDLES[(bits >>> 14) % UPI_HANDLES.length]}`, type: 'upi' };
+  }
+  if (share < identifierMix.upi + identifierMix.phone) {
+    // 10-digit mobile numbers starting 6-9, unique per rank
+    const number = `${6 + ((bits >>> 14) % 4)}${String(rank).padStart(9, '0').slice(-9)}`;
+    return { identifier: `phone_${number}`, type: 'phone' };
+  }
+  // Keyed the way LinkChecker keys a normalized payment link
+  const link = `https://${name}-${rank.toString(36)}.${LINK_DOMAINS[(bits >>> 14) % LINK_DOMAINS.length]}/pay`;
+  return { identifier: `link_${btoa(link).replace(/[^a-zA-Z0-9]/g, '_')}`, type: 'link', link };
+};
+
+// Yield `reports` NDJSON-shaped rows ({ identifier, ...report fields }) over
+// `identifiers` offenders, chosen by a Zipf distribution so a few are reported
+// again and again. Amounts are log-normal and grow with severity; timestamps
+// fall within the last `days` days, denser toward `now`.
+export function* generateReports({
+  seed = 1,
+  reports = 1000,
+  identifiers = Math.max(1, Math.ceil(reports / 4)),
+  zipfExponent = 1.1,
+  identifierMix,
+  days = 90,
+  now = Date.now()
+} = {}) {
+  const random = createRandom(seed);
+  const offender = createZipf(identifiers, zipfExponent, random);
+
+  for (let i = 0; i < reports; i++) {
+    const { identifier, type, link } = syntheticIdentifier(offender(), { identifierMix });
+    const category = type === 'phone' ? 'phone_fraud'
+      : type === 'link' ? 'link_fraud'
+      : pick(random, REPORT_CATEGORIES, UPI_CATEGORY_WEIGHTS);
+    const severity = pick(random, [1, 2, 3, 4, 5], SEVERITY_WEIGHTS);
+
+    const templates = DESCRIPTIONS[category];
+    const description = templates[Math.floor(random() * templates.length)]
+      .replace('{item}', ITEMS[Math.floor(random() * ITEMS.length)]);
+
+    const row = {
+      identifier,
+      id: `rpt_syn${seed}_${i.toString(36)}`,
+      timestamp: Math.round(now - random() ** 1.5 * days * DAY_MS),
+      description,
+      severity,
+      category,
+      reportedBy: `user${Math.floor(random() * 50000)}@example.com`,
+      verified: false,
+      reportedFrom: type === 'phone' ? 'phone_checker' : type === 'link' ? 'link_checker' : 'web_app'
+    };
+    // A quarter of reports leave the optional amount blank
+    if (random() >= 0.25) {
+      row.amount = Math.min(1000000, Math.round(Math.exp(Math.log(300) + 0.6 * (severity - 1) + 1.2 * gaussian(random))));
+    }
+    if (link) {
+      row.originalLink = link;
+      row.domain = new URL(link).hostname;
+    }
+    yield row;
+  }
+}
+
+// NDJSON text for the generated reports, `batchSize` lines per chunk
+export function* generateNdjson(options = {}, batchSize = 1000) {
+  let chunk = '';
+  let lines = 0;
+  for (const row of generateReports(options)) {
+    chunk += JSON.stringify(row) + '\n';
+    if (++lines === batchSize) {
+      yield chunk;
+      chunk = '';
+      lines = 0;
+    }
+  }
+  if (chunk) {
+    yield chunk;
+  }
+}
+
+// A byte stream of NDJSON, generated only as fast as the reader pulls it
+export const syntheticReportStream = (options = {}) => {
+  const chunks = generateNdjson(options);
+  const encoder = new TextEncoder();
+  return new ReadableStream({
+    pull(controller) {
+      const { value, done } = chunks.next();
+      if (done) {
+        controller.close();
+      } else {
+        controller.enqueue(encoder.encode(value));
+      }
+    }
+  });
+};
+
+// Stream generated reports into a fraud database's bulk import (the engine or
+// the worker client); resolves with importReports' progress totals
+export const importSyntheticReports = (database, options = {}, { onProgress } = {}) =>
+  database.importReports(syntheticReportStream(options), { format: 'ndjson', onProgress });
+
+export default { generateReports, generateNdjson, syntheticReportStream, importSyntheticReports };
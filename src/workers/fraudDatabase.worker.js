@@ -0,0 +1,47 @@
+// Fraud Database Worker - hosts the FraudDatabase engine off the UI thread
+import FraudDatabase from '../services/fraudEngine.js';
+import { ENGINE_METHODS } from '../services/fraudDatabaseApi.js';
+import FraudStorage from '../services/fraudStorage.js';
+
+let engine = null;
+
+// AbortControllers for cancellable calls in flight, by call id
+const controllers = new Map();
+
+self.onmessage = async (event) => {
+  const { type, id, method, args, withProgress, withSignal } = event.data;
+
+  // The page sends the legacy localStorage blob first, since workers can't read it
+  if (type === 'init') {
+    engine = new FraudDatabase(new FraudStorage(), { legacyJson: event.data.legacyJson });
+    return;
+  }
+
+  if (type === 'cancel') {
+    const controller = controllers.get(id);
+    if (controller) controller.abort();
+    return;
+  }
+
+  try {
+    if (method !== 'whenReady' && !ENGINE_METHODS.includes(method)) {
+      throw new Error(`Unknown fraud database method: ${method}`);
+    }
+    if (withProgress) {
+      // The last argument is the options object; give it a callback that reports back
+      const options = args[args.length - 1];
+      options.onProgress = (progress) => self.postMessage({ id, progress });
+    }
+    if (withSignal) {
+      const controller = new AbortController();
+      controllers.set(id, controller);
+      args[args.length - 1].signal = controller.signal;
+    }
+    const result = method === 'whenReady' ? await engine.ready : await engine[method](...args);
+    self.postMessage({ id, result });
+  } catch (error) {
+    self.postMessage({ id, error: error.message || String(error) });
+  } finally {
+    controllers.delete(id);
+  }
+};
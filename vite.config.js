@@ -4,4 +4,8 @@ import react from '@vitejs/plugin-react'
 // https://vite.dev/config/
 export default defineConfig({
   plugins: [react()],
+  worker: {
+    // The fraud database worker is an ES module that imports the engine
+    format: 'es',
+  },
 })